@@ -10,6 +10,7 @@
     python -m src.features.oiljang_form_filler
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from PyQt5.QtWidgets import QApplication, QMessageBox
 
@@ -33,26 +34,39 @@ def main():
     # QApplication 먼저 생성 (에러 다이얼로그 표시용)
     app = QApplication(sys.argv)
 
+    from src.features.oiljang_form_filler.infra.preset_repository import PresetRepository
+    from src.shared.browser.chrome_controller import ChromeController
+
+    # 크롬 연결(실행 + 대기)은 수 초 걸리므로 백그라운드에서 돌리고,
+    # 그동안 메인 스레드는 프리셋 파일을 미리 읽어 둔다 (윈도우 생성 시 캐시 사용)
+    executor = ThreadPoolExecutor(max_workers=1)
     try:
         # 크롬 컨트롤러 생성 (크롬 자동 실행)
-        from src.shared.browser.chrome_controller import ChromeController
-
         logger.info("크롬 연결 중...")
-        chrome_controller = ChromeController()
+        controller_future = executor.submit(ChromeController)
+
+        preset_repository = PresetRepository()
+        try:
+            preset_repository.load()
+        except Exception:
+            # 여기서는 미리 읽기만, 실패 처리는 윈도우의 프리셋 로드에서
+            logger.warning("프리셋 미리 읽기 실패")
+
+        chrome_controller = controller_future.result()
         logger.info("크롬 연결 성공")
 
     except RuntimeError as e:
         logger.exception("크롬 연결 실패", exc_info=e)
         QMessageBox.critical(None, "연결 실패", str(e))
         sys.exit(1)
+    finally:
+        executor.shutdown(wait=False)
 
     try:
         # 인프라 레이어 생성
         from src.features.oiljang_form_filler.infra.form_filler import OiljangFormFiller
-        from src.features.oiljang_form_filler.infra.preset_repository import PresetRepository
 
         form_filler = OiljangFormFiller(chrome_controller)
-        preset_repository = PresetRepository()
 
         # 앱 레이어 생성 (유즈케이스)
         from src.features.oiljang_form_filler.app.fill_field_use_case import FillFieldUseCase
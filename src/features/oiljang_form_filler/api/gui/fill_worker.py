@@ -0,0 +1,64 @@
+"""
+레이어: api/gui
+역할: 전송 작업 백그라운드 실행기
+의존: shared/logging/app_logger.py
+외부: PyQt5
+
+목적: 셀레니움 호출(유즈케이스 실행)을 QThreadPool에서 돌려 GUI 스레드가 멈추지 않게 함
+"""
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from src.shared.logging.app_logger import get_logger
+
+logger = get_logger()
+
+
+class FillWorkerSignals(QObject):
+    """
+    FillWorker 시그널 묶음
+
+    QRunnable은 QObject가 아니라 시그널을 직접 가질 수 없어서 따로 둔다.
+    메인 스레드에서 생성되므로 슬롯은 메인 스레드에서 실행된다.
+
+    Signals:
+        finished: 작업 성공 시 발생 (작업 반환값 전달)
+        failed: 작업 중 예외 발생 시 발생 (에러 메시지 전달)
+    """
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class FillWorker(QRunnable):
+    """
+    유즈케이스 실행을 감싸는 QRunnable
+
+    예:
+        worker = FillWorker(use_case.execute, fields)
+        worker.signals.finished.connect(on_done)
+        QThreadPool.globalInstance().start(worker)
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        """
+        Args:
+            fn: 백그라운드에서 실행할 함수
+            *args, **kwargs: fn에 넘길 인자
+        """
+        super().__init__()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self.signals = FillWorkerSignals()
+
+    def run(self) -> None:
+        """워커 스레드에서 실행됨"""
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+        except Exception as e:
+            logger.exception("백그라운드 전송 작업 실패")
+            self.signals.failed.emit(str(e))
+            return
+
+        self.signals.finished.emit(result)
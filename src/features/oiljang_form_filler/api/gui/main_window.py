@@ -1,12 +1,12 @@
 """
 레이어: api/gui
 역할: 오일장 폼 자동 채우기 메인 윈도우
-의존: app/use_cases, api/gui/row_widget.py, domain
+의존: app/use_cases, api/gui/row_widget.py, api/gui/fill_worker.py, domain
 외부: PyQt5
 
 목적: 사용자가 폼 필드를 설정하고 전송하는 메인 UI
 """
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThreadPool
 from PyQt5.QtWidgets import (
     QAction,
     QFrame,
@@ -20,6 +20,7 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
+from src.features.oiljang_form_filler.api.gui.fill_worker import FillWorker
 from src.features.oiljang_form_filler.api.gui.row_widget import (
     FIELD_CONFIG,
     RowWidget,
@@ -72,7 +73,12 @@ class MainWindow(QWidget):
         self._send_all = send_all_use_case
 
         self.rows: list[RowWidget] = []
-        self.status_history: list[str] = []
+
+        # 프리셋 일괄 로드 중에는 행별 상태 메시지를 생략 (마지막에 한 번만 표시)
+        self._bulk_loading = False
+
+        # 실행 중인 전송 작업 (셀레니움 드라이버는 동시 호출 불가라 한 번에 하나만)
+        self._active_worker: FillWorker | None = None
 
         self._init_ui()
         self._load_presets_on_start()
@@ -130,6 +136,8 @@ class MainWindow(QWidget):
         self.status_box.setMinimumHeight(100)
         self.status_box.setFrameStyle(QFrame.StyledPanel | QFrame.Sunken)
         self.status_box.setPlaceholderText("상태 메시지가 여기에 표시돼.")
+        # 최대 개수 유지는 Qt에 맡김 (넘치면 오래된 줄부터 자동 삭제)
+        self.status_box.setMaximumBlockCount(self.STATUS_HISTORY_MAX)
 
         # 하단 레이아웃
         bottom_layout = QHBoxLayout()
@@ -154,14 +162,33 @@ class MainWindow(QWidget):
         presets, msg = self._load_presets.execute()
 
         if presets:
-            for preset in presets:
-                self._add_row(preset)
+            self._add_rows_from_presets(presets)
             self._update_status(msg)
         else:
             # 프리셋 없으면 빈 행 하나 추가
             self._add_row()
             self._update_status("새로운 항목을 추가해줘.")
 
+    def _add_rows_from_presets(self, presets: list[FormPreset]) -> None:
+        """
+        프리셋 목록으로 행 일괄 추가
+
+        이유: 행마다 상태 박스를 다시 그리면 N번 갱신되므로,
+        로드 중에는 건너뛰고 호출자가 마지막에 한 번만 상태를 표시한다.
+        화면 갱신도 멈춰서 행 N개를 넣는 동안 다시 그리기는 끝에서 한 번만 한다.
+
+        Args:
+            presets: 추가할 프리셋 목록
+        """
+        self._bulk_loading = True
+        self.setUpdatesEnabled(False)
+        try:
+            for preset in presets:
+                self._add_row(preset)
+        finally:
+            self.setUpdatesEnabled(True)
+            self._bulk_loading = False
+
     def _add_row(self, preset: FormPreset = None) -> None:
         """
         행 추가
@@ -190,6 +217,9 @@ class MainWindow(QWidget):
 
         logger.info("행 추가됨. 현재 행 수: %d", len(self.rows))
 
+        if self._bulk_loading:
+            return
+
         if preset:
             self._update_status(f"프리셋 '{preset.item}' 추가됨.")
         else:
@@ -213,13 +243,21 @@ class MainWindow(QWidget):
             self._update_status("셀렉트 항목은 내용 칸을 채워줘.")
             return
 
-        # 전송 실행
-        success, msg = self._fill_field.execute(
+        # 전송 실행 (백그라운드, 결과는 _on_row_submit_done에서 처리)
+        worker = FillWorker(
+            self._fill_field.execute,
             locator_type=row.get_locator_type(),
             locator_value=locator_value,
             input_value=input_value,
             mode=mode,
         )
+        on_done = lambda result: self._on_row_submit_done(item_label, result)
+        if self._start_worker(worker, on_done):
+            self._update_status(f"'{item_label}' 전송 중...")
+
+    def _on_row_submit_done(self, item_label: str, result: tuple[bool, str]) -> None:
+        """개별 행 전송 완료 처리 (메인 스레드)"""
+        success, msg = result
 
         if success:
             QMessageBox.information(self, "완료", "입력 성공!")
@@ -235,22 +273,36 @@ class MainWindow(QWidget):
             self._update_status("전송할 항목이 없어.")
             return
 
-        # 필드 정보 수집
-        fields = []
-        for row in self.rows:
-            fields.append({
+        # 필드 정보 수집 (위젯 값은 여기서 한 번만 읽어 일반 dict로 넘김)
+        fields = [
+            {
                 "item": row.get_item_label(),
                 "locator_type": row.get_locator_type(),
-                "locator_value": row.get_locator_value(),
+                "locator_value": row.get_locator_value().strip(),
                 "input_value": row.get_input_value(),
                 "mode": row.get_mode(),
-            })
+            }
+            for row in self.rows
+        ]
+
+        # 이름 칸이 다 비어 있으면 작업을 띄우지 않고 바로 안내
+        if not any(field["locator_value"] for field in fields):
+            QMessageBox.information(self, "모두 전송", "이름 칸이 채워진 항목이 없어!")
+            self._update_status(f"전송할 항목이 없어. (스킵: {len(fields)})")
+            return
+
+        # 전송 실행 (백그라운드, 결과는 _on_send_all_done에서 처리)
+        total = len(fields)
+        worker = FillWorker(self._send_all.execute, fields)
+        on_done = lambda result: self._on_send_all_done(total, result)
+        if self._start_worker(worker, on_done):
+            self._update_status(f"모두 전송 중... ({total}건)")
 
-        # 전송 실행
-        success, skipped, failures = self._send_all.execute(fields)
+    def _on_send_all_done(self, total: int, result: tuple[int, int, list[str]]) -> None:
+        """모두 전송 완료 처리 (메인 스레드)"""
+        success, skipped, failures = result
 
         # 결과 표시
-        total = len(self.rows)
         summary_lines = [
             f"총 행 수: {total}",
             f"성공: {success}",
@@ -263,6 +315,52 @@ class MainWindow(QWidget):
         QMessageBox.information(self, "모두 전송", "\n".join(summary_lines))
         self._update_status(" / ".join(summary_lines))
 
+    def _start_worker(self, worker: FillWorker, on_done) -> bool:
+        """
+        전송 작업을 스레드 풀에 넣기
+
+        이유: 셀레니움 호출(+재시도 대기)을 GUI 스레드에서 돌리면 창이 수 초간 멈춘다.
+        드라이버는 스레드 안전하지 않으므로 이미 전송 중이면 새 작업을 받지 않는다.
+
+        Args:
+            worker: 실행할 작업
+            on_done: 작업 반환값을 받는 완료 콜백 (메인 스레드에서 호출)
+
+        Returns:
+            bool: 작업 시작 여부
+        """
+        if self._active_worker is not None:
+            self._update_status("아직 전송 중이야. 끝나면 다시 눌러줘.")
+            return False
+
+        # 정리 먼저 연결해서 결과 팝업이 떠 있는 동안에도 다음 전송이 가능하게 함
+        worker.signals.finished.connect(self._on_worker_finished)
+        worker.signals.finished.connect(on_done)
+        worker.signals.failed.connect(self._on_worker_failed)
+
+        # 완료 시그널 전달 전에 래퍼가 회수되지 않도록 참조 유지
+        self._active_worker = worker
+        self._set_sending(True)
+        QThreadPool.globalInstance().start(worker)
+        return True
+
+    def _on_worker_finished(self, _result: object) -> None:
+        """전송 작업 종료 후 정리"""
+        self._active_worker = None
+        self._set_sending(False)
+
+    def _on_worker_failed(self, error: str) -> None:
+        """전송 작업 예외 처리"""
+        self._active_worker = None
+        self._set_sending(False)
+
+        QMessageBox.warning(self, "전송 실패", error)
+        self._update_status(f"전송 중 오류: {error}")
+
+    def _set_sending(self, sending: bool) -> None:
+        """전송 중에는 모두 전송 버튼 비활성화"""
+        self.send_all_button.setEnabled(not sending)
+
     def _on_save(self) -> None:
         """프리셋 저장"""
         presets = []
@@ -303,9 +401,7 @@ class MainWindow(QWidget):
 
         # 기존 행 삭제 후 새로 추가
         self._clear_rows()
-
-        for preset in presets:
-            self._add_row(preset)
+        self._add_rows_from_presets(presets)
 
         if not self.rows:
             self._add_row()
@@ -314,19 +410,30 @@ class MainWindow(QWidget):
         self._update_status(msg)
 
     def _clear_rows(self) -> None:
-        """모든 행 삭제"""
-        while self.rows:
-            row = self.rows.pop()
-            row.setParent(None)
-            row.deleteLater()
+        """
+        모든 행 삭제
+
+        이유: 행마다 떼어내면 레이아웃이 N번 다시 계산되므로,
+        화면 갱신을 멈춘 채 한 번에 떼어내고 레이아웃은 끝에서 한 번만 맞춘다.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            for row in self.rows:
+                self.rows_layout.removeWidget(row)
+                row.setParent(None)
+                row.deleteLater()
+            self.rows.clear()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.rows_layout.activate()
 
         logger.info("모든 행 삭제됨")
 
     def _move_row_up(self, row: RowWidget) -> None:
         """행 위로 이동"""
-        try:
-            index = self.rows.index(row)
-        except ValueError:
+        # 레이아웃에는 행 위젯만 들어 있어 레이아웃 순서 == self.rows 순서
+        index = self.rows_layout.indexOf(row)
+        if index < 0:
             return
 
         if index == 0:
@@ -342,9 +449,9 @@ class MainWindow(QWidget):
 
     def _move_row_down(self, row: RowWidget) -> None:
         """행 아래로 이동"""
-        try:
-            index = self.rows.index(row)
-        except ValueError:
+        # 레이아웃에는 행 위젯만 들어 있어 레이아웃 순서 == self.rows 순서
+        index = self.rows_layout.indexOf(row)
+        if index < 0:
             return
 
         if index == len(self.rows) - 1:
@@ -375,9 +482,9 @@ class MainWindow(QWidget):
 
     def _delete_row(self, row: RowWidget, label: str) -> None:
         """행 삭제"""
-        try:
-            index = self.rows.index(row)
-        except ValueError:
+        # 레이아웃에는 행 위젯만 들어 있어 레이아웃 순서 == self.rows 순서
+        index = self.rows_layout.indexOf(row)
+        if index < 0:
             return
 
         self.rows_layout.removeWidget(row)
@@ -398,14 +505,8 @@ class MainWindow(QWidget):
         if not text:
             return
 
-        self.status_history.append(text)
-
-        # 최대 개수 유지
-        if len(self.status_history) > self.STATUS_HISTORY_MAX:
-            self.status_history = self.status_history[-self.STATUS_HISTORY_MAX:]
-
-        display = "\n".join(self.status_history)
-        self.status_box.setPlainText(display)
+        # 전체 텍스트를 다시 그리지 않고 한 줄만 추가
+        self.status_box.appendPlainText(text)
 
         # 스크롤 맨 아래로
         cursor = self.status_box.textCursor()
@@ -60,6 +60,10 @@ class RowWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+
+        # 컨텍스트 메뉴 (처음 우클릭할 때 한 번만 생성해서 재사용)
+        self._menu: QMenu | None = None
+
         self._init_ui()
 
     def _init_ui(self) -> None:
@@ -172,30 +176,37 @@ class RowWidget(QWidget):
         self.locator_input.setText(locator_value)
         self.value_input.clear()
 
+    def _ensure_menu(self) -> QMenu:
+        """
+        컨텍스트 메뉴 생성 (최초 1회)
+
+        이유: 우클릭마다 QMenu(self)를 만들면 행이 삭제될 때까지 메뉴가 계속 쌓임
+        """
+        if self._menu is None:
+            self._menu = QMenu(self)
+            self._move_up_action = self._menu.addAction("위로 이동")
+            self._move_down_action = self._menu.addAction("아래로 이동")
+            self._delete_action = self._menu.addAction("삭제")
+        return self._menu
+
     def _show_context_menu(self, pos) -> None:
         """컨텍스트 메뉴 표시"""
         global_pos = self.mapToGlobal(pos)
-        menu = QMenu(self)
-
-        move_up_action = menu.addAction("위로 이동")
-        move_down_action = menu.addAction("아래로 이동")
-        delete_action = menu.addAction("삭제")
+        menu = self._ensure_menu()
 
         # 첫 번째/마지막 행이면 이동 비활성화
-        if self._is_first_row():
-            move_up_action.setEnabled(False)
-        if self._is_last_row():
-            move_down_action.setEnabled(False)
+        self._move_up_action.setEnabled(not self._is_first_row())
+        self._move_down_action.setEnabled(not self._is_last_row())
 
         action = menu.exec_(global_pos)
         if action is None:
             return
 
-        if action == move_up_action:
+        if action == self._move_up_action:
             self.move_up_requested.emit(self)
-        elif action == move_down_action:
+        elif action == self._move_down_action:
             self.move_down_requested.emit(self)
-        elif action == delete_action:
+        elif action == self._delete_action:
             self.delete_requested.emit(self)
 
     def _is_first_row(self) -> bool:
@@ -23,11 +23,11 @@ class FillFieldUseCase:
     단일 필드 채우기 유즈케이스
 
     폼 필러를 사용하여 하나의 필드를 채움
-    실패 시 최대 3회 재시도
+    실패 시 최대 3회 재시도 (설정 오류인 ValueError는 재시도하지 않음)
     """
 
     MAX_RETRY = 3
-    RETRY_DELAY = 1  # 초
+    RETRY_BACKOFF = 0.25  # 초, 시도 횟수만큼 늘어남 (0.25 → 0.5)
 
     def __init__(self, form_filler: OiljangFormFiller):
         """
@@ -71,6 +71,11 @@ class FillFieldUseCase:
                 )
                 logger.info("필드 채우기 성공: %s", locator_value)
                 return True, "입력 성공"
+            except ValueError as e:
+                # 찾기 방식/이름 같은 설정 오류는 다시 해도 같은 결과라 바로 중단
+                last_error = e
+                logger.exception("필드 채우기 실패 (설정 오류, 재시도 안 함)")
+                break
             except Exception as e:
                 last_error = e
                 logger.exception(
@@ -78,8 +83,30 @@ class FillFieldUseCase:
                     attempt, self.MAX_RETRY,
                 )
                 if attempt < self.MAX_RETRY:
-                    time.sleep(self.RETRY_DELAY)
+                    time.sleep(self.RETRY_BACKOFF * attempt)
 
         error_msg = f"입력 실패: {last_error}"
         logger.error(error_msg)
         return False, error_msg
+
+    def execute_batch(
+        self, specs: list[tuple[LocatorType, str, str]]
+    ) -> list[bool]:
+        """
+        텍스트 필드 여러 개를 한 번에 채우기 (재시도 없음)
+
+        Args:
+            specs: (찾기 방식, 찾을 값, 입력할 값) 목록
+
+        Returns:
+            list[bool]: 앞에서부터 항목별 성공 여부.
+                처음 실패한 항목까지만 들어 있고, 일괄 입력 자체가 실패하면 빈 리스트.
+                실패/누락 항목은 호출자가 execute()로 다시 처리해야 함
+        """
+        try:
+            codes = self._form_filler.fill_many(specs)
+        except Exception:
+            logger.exception("텍스트 필드 일괄 입력 실패, 개별 입력으로 진행")
+            return []
+
+        return [code == "ok" for code in codes]
@@ -44,8 +44,11 @@ class SavePresetsUseCase:
             return False, "저장할 프리셋이 없어!"
 
         try:
-            self._repository.save(presets)
-            msg = f"{len(presets)}건 저장 완료"
+            written = self._repository.save(presets)
+            if written:
+                msg = f"{len(presets)}건 저장 완료"
+            else:
+                msg = f"변경 없음 ({len(presets)}건 그대로 유지)"
             logger.info(msg)
             return True, msg
         except OSError as e:
@@ -21,6 +21,7 @@ class SendAllUseCase:
     모두 전송 유즈케이스
 
     여러 필드를 순차적으로 채움
+    연속된 텍스트 필드는 한 번에 일괄 입력하고, 안 되는 항목만 개별 입력
     실패 시 즉시 중단
     """
 
@@ -58,6 +59,9 @@ class SendAllUseCase:
         total = len(fields)
         logger.info("모두 전송 시작: %d건", total)
 
+        # 연속된 텍스트 필드는 모아서 한 번에 채움 (셀렉트를 만나면 먼저 비움)
+        text_run: list[tuple[int, str, dict]] = []
+
         for idx, field in enumerate(fields, start=1):
             locator_value = field.get("locator_value", "").strip()
             item_name = field.get("item") or locator_value or f"{idx}번째"
@@ -68,23 +72,28 @@ class SendAllUseCase:
                 logger.info("스킵 (%d/%d): %s (locator 비어있음)", idx, total, item_name)
                 continue
 
-            logger.info("전송 중 (%d/%d): %s", idx, total, item_name)
+            if field.get("mode", FieldMode.NORMAL) == FieldMode.NORMAL:
+                text_run.append((idx, item_name, field))
+                continue
 
-            # 필드 채우기 시도
-            ok, msg = self._fill_field.execute(
-                locator_type=field.get("locator_type", LocatorType.ID),
-                locator_value=locator_value,
-                input_value=field.get("input_value", ""),
-                mode=field.get("mode", FieldMode.NORMAL),
-            )
+            # 셀렉트는 옵션이 앞 필드에 따라 바뀔 수 있으므로 앞선 텍스트 필드부터 처리
+            done, failed = self._flush_text_run(text_run, total)
+            success += done
+            text_run = []
+            if failed:
+                failures.append(failed)
+                break
 
-            if ok:
+            if self._send_one(idx, total, item_name, field):
                 success += 1
-                logger.info("성공 (%d/%d): %s", idx, total, item_name)
             else:
                 failures.append(item_name)
-                logger.warning("실패로 중단 (%d/%d): %s - %s", idx, total, item_name, msg)
                 break  # 실패 시 즉시 중단
+        else:
+            done, failed = self._flush_text_run(text_run, total)
+            success += done
+            if failed:
+                failures.append(failed)
 
         logger.info(
             "모두 전송 완료: 성공=%d, 스킵=%d, 실패=%d",
@@ -92,3 +101,66 @@ class SendAllUseCase:
         )
 
         return success, skipped, failures
+
+    def _flush_text_run(
+        self, run: list[tuple[int, str, dict]], total: int
+    ) -> tuple[int, str | None]:
+        """
+        모아둔 텍스트 필드를 일괄 입력
+
+        일괄 입력은 드라이버 왕복 한 번으로 끝나지만 대기/재시도가 없으므로,
+        실패했거나 시도되지 않은 항목부터는 개별 입력(대기 + 재시도)으로 처리한다.
+
+        Args:
+            run: (순번, 표시 이름, 필드 정보) 목록
+            total: 전체 필드 수 (로그용)
+
+        Returns:
+            tuple[int, str | None]: (성공 수, 실패 항목 이름 또는 None)
+        """
+        if not run:
+            return 0, None
+
+        results = self._fill_field.execute_batch([
+            (
+                field.get("locator_type", LocatorType.ID),
+                field.get("locator_value", "").strip(),
+                field.get("input_value", ""),
+            )
+            for _, _, field in run
+        ])
+
+        success = 0
+        for pos, (idx, item_name, field) in enumerate(run):
+            if pos < len(results) and results[pos]:
+                success += 1
+                logger.info("성공 (%d/%d): %s", idx, total, item_name)
+                continue
+
+            if not self._send_one(idx, total, item_name, field):
+                return success, item_name
+            success += 1
+
+        return success, None
+
+    def _send_one(self, idx: int, total: int, item_name: str, field: dict) -> bool:
+        """
+        필드 하나 개별 입력 (재시도 포함)
+
+        Returns:
+            bool: 성공 여부
+        """
+        logger.info("전송 중 (%d/%d): %s", idx, total, item_name)
+
+        ok, msg = self._fill_field.execute(
+            locator_type=field.get("locator_type", LocatorType.ID),
+            locator_value=field.get("locator_value", "").strip(),
+            input_value=field.get("input_value", ""),
+            mode=field.get("mode", FieldMode.NORMAL),
+        )
+
+        if ok:
+            logger.info("성공 (%d/%d): %s", idx, total, item_name)
+        else:
+            logger.warning("실패로 중단 (%d/%d): %s - %s", idx, total, item_name, msg)
+        return ok
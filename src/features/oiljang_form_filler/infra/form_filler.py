@@ -2,7 +2,7 @@
 레이어: infra
 역할: 오일장 사이트 폼 필드 채우기 구현
 의존: domain/value_objects.py, shared/browser/chrome_controller.py
-외부: selenium
+외부: selenium, rapidfuzz (선택, 없으면 difflib으로 폴백)
 
 목적: Selenium을 사용하여 실제 폼 필드에 값을 입력
 
@@ -18,6 +18,11 @@ import re
 import time
 from difflib import SequenceMatcher
 
+try:
+    from rapidfuzz import fuzz
+except ImportError:  # rapidfuzz 미설치 환경: difflib 사용
+    fuzz = None
+
 from selenium.common.exceptions import (
     InvalidElementStateException,
     NoSuchElementException,
@@ -27,17 +32,136 @@ from selenium.common.exceptions import (
 )
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select, WebDriverWait
+from selenium.webdriver.support.ui import WebDriverWait
 
 from src.features.oiljang_form_filler.domain.value_objects import (
     FieldMode,
     LocatorType,
 )
 from src.shared.browser.chrome_controller import ChromeController
-from src.shared.logging.app_logger import get_logger
+from src.shared.logging.app_logger import get_logger, is_verbose_logging
 
 logger = get_logger()
 
+# 옵션 정규화용 패턴 (옵션마다 호출되므로 미리 컴파일)
+# 공백도 [^\w가-힣]에 걸리므로 한 번의 치환으로 공백/기호를 같이 지움
+_NONWORD_RE = re.compile(r"[^\w가-힣]")
+
+# select 상태를 한 번의 왕복으로 읽는 스크립트
+# 옵션마다 .text / get_attribute("value")를 부르면 옵션 N개에 2N번 왕복하게 됨
+# <select>가 아니면 null 반환
+_READ_SELECT_JS = """
+const el = arguments[0];
+if (!el || el.tagName !== 'SELECT') return null;
+return {
+    enabled: !el.disabled,
+    options: Array.from(el.options).map(o => [o.text.trim(), o.value || '']),
+};
+"""
+
+# select 옵션을 인덱스로 선택하고 input/change 이벤트를 발생시키는 스크립트
+# Select(element).select_by_index는 태그 확인 + 옵션마다 index 조회로 여러 번 왕복함
+# select_by_index처럼 비활성화된 select/옵션은 선택하지 않고 결과 코드를 반환
+# (:disabled는 비활성 fieldset/optgroup 안에 있는 경우까지 포함)
+_SELECT_INDEX_JS = """
+const el = arguments[0];
+const index = arguments[1];
+if (el.matches(':disabled')) return 'disabled';
+const option = el.options[index];
+if (!option) return 'missing';
+if (option.matches(':disabled')) return 'option_disabled';
+el.selectedIndex = index;
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+return el.selectedIndex === index ? 'ok' : 'not_applied';
+"""
+
+# 텍스트 필드 채우기 JS 함수 (아래 스크립트들이 공유)
+# 상태 확인 + 값 설정 + input/change 이벤트 발생까지 처리하고 결과 코드를 반환
+# (프레임워크가 value setter를 가로채는 경우를 위해 프로토타입의 원래 setter 사용)
+_SET_TEXT_JS_FN = """
+function setText(el, text) {
+    if (!el || !el.isConnected) return 'missing';
+    if (!(el instanceof HTMLInputElement || el instanceof HTMLTextAreaElement)) return 'unsupported';
+    if (el.disabled) return 'disabled';
+    if (el.readOnly) return 'readonly';
+    const proto = Object.getPrototypeOf(el);
+    const desc = Object.getOwnPropertyDescriptor(proto, 'value');
+    el.focus();
+    if (desc && desc.set) { desc.set.call(el, text); } else { el.value = text; }
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    return 'ok';
+}
+"""
+
+# 이미 찾은 요소 하나를 채우는 스크립트
+_FILL_TEXT_JS = _SET_TEXT_JS_FN + "return setText(arguments[0], arguments[1]);"
+
+# Selenium By 문자열(by)과 찾을 값으로 요소 하나를 찾는 JS 함수 (아래 스크립트들이 공유)
+_FIND_JS_FN = """
+function find(by, value) {
+    switch (by) {
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+        case 'css selector': return document.querySelector(value);
+        case 'xpath': return document.evaluate(
+            value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    return null;
+}
+"""
+
+# 여러 텍스트 필드를 한 번의 왕복으로 채우는 스크립트
+# arguments[0]: [[by, locator_value, text], ...] (by는 Selenium By 문자열)
+# 순서대로 채우다가 처음 실패한 곳에서 멈추고 그때까지의 결과 코드 목록을 반환
+_FILL_MANY_JS = _SET_TEXT_JS_FN + _FIND_JS_FN + """
+const results = [];
+for (const [by, value, text] of arguments[0]) {
+    let code;
+    try {
+        code = setText(find(by, value), text);
+    } catch (e) {
+        code = 'invalid';
+    }
+    results.push(code);
+    if (code !== 'ok') break;
+}
+return results;
+"""
+
+# select 옵션 대기용 폴링 스크립트: 요소 찾기 + 상태 읽기를 한 번의 왕복으로
+# 활성화된 <select>면 {element, options}, 아니면 null 반환
+_POLL_SELECT_JS = _FIND_JS_FN + """
+let el;
+try {
+    el = find(arguments[0], arguments[1]);
+} catch (e) {
+    return null;
+}
+if (!el || el.tagName !== 'SELECT' || el.disabled) return null;
+return {
+    element: el,
+    options: Array.from(el.options).map(o => [o.text.trim(), o.value || '']),
+};
+"""
+
+# 텍스트 필드 재시도용 상태 스크립트: 요소 찾기 + 활성화/readonly 확인을 한 번의 왕복으로
+# find_element + is_enabled + get_attribute("readonly")를 따로 부르면 시도마다 3번 왕복함
+# 요소가 없으면 null, 있으면 {element, enabled, readonly}
+_TEXT_STATE_JS = _FIND_JS_FN + """
+let el;
+try {
+    el = find(arguments[0], arguments[1]);
+} catch (e) {
+    return null;
+}
+if (!el) return null;
+return {element: el, enabled: !el.disabled, readonly: !!el.readOnly};
+"""
+
 
 class OiljangFormFiller:
     """
@@ -55,6 +179,13 @@ class OiljangFormFiller:
         LocatorType.XPATH: By.XPATH,
     }
 
+    # 요소/옵션 대기 설정 (기본 폴링 0.5초는 빠른 페이지에서 매번 최대 0.5초를 버림)
+    WAIT_TIMEOUT_SECONDS = 10
+    WAIT_POLL_SECONDS = 0.05
+    # 텍스트 요소 준비 대기 (예전 0.5초 × 3회 재시도와 같은 상한)
+    TEXT_READY_TIMEOUT_SECONDS = 1.5
+    TEXT_READY_POLL_SECONDS = 0.1
+
     def __init__(self, chrome_controller: ChromeController):
         """
         폼 필러 초기화
@@ -65,6 +196,19 @@ class OiljangFormFiller:
         self._controller = chrome_controller
         self._driver = chrome_controller.get_driver()
 
+        # 짧은 폴링 간격의 명시적 대기 (드라이버가 바뀌지 않으므로 한 번만 만들어 재사용)
+        self._element_wait = WebDriverWait(
+            self._driver,
+            self.WAIT_TIMEOUT_SECONDS,
+            poll_frequency=self.WAIT_POLL_SECONDS,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException),
+        )
+        self._text_ready_wait = WebDriverWait(
+            self._driver,
+            self.TEXT_READY_TIMEOUT_SECONDS,
+            poll_frequency=self.TEXT_READY_POLL_SECONDS,
+        )
+
     def fill_field(
         self,
         locator_type: LocatorType,
@@ -82,7 +226,7 @@ class OiljangFormFiller:
             mode: 입력 방식 (NORMAL 또는 SELECT)
 
         Raises:
-            ValueError: locator_value가 비어있을 때
+            ValueError: locator_value가 비어있거나 셀렉트/옵션이 비활성화되어 있을 때
             RuntimeError: 요소를 찾지 못하거나 입력 실패 시
         """
         logger.info(
@@ -105,17 +249,17 @@ class OiljangFormFiller:
         # 활성 탭으로 포커스
         self._controller.focus_active_tab()
 
-        # 현재 페이지 정보 로깅
-        try:
-            logger.info("현재 URL: %s", self._driver.current_url)
-            logger.info("현재 제목: %s", self._driver.title)
-        except WebDriverException:
-            logger.warning("현재 URL/제목을 가져오지 못함")
+        # 현재 페이지 정보 로깅 (URL/제목 조회가 각각 드라이버 왕복이라 상세 로그 켰을 때만)
+        if is_verbose_logging():
+            try:
+                logger.debug("현재 URL: %s", self._driver.current_url)
+                logger.debug("현재 제목: %s", self._driver.title)
+            except WebDriverException:
+                logger.warning("현재 URL/제목을 가져오지 못함")
 
         # 요소 찾기
         try:
-            wait = WebDriverWait(self._driver, 10)
-            element = wait.until(EC.presence_of_element_located((by, locator_value)))
+            element = self._element_wait.until(EC.presence_of_element_located((by, locator_value)))
         except (NoSuchElementException, TimeoutException) as e:
             logger.exception("요소 찾기 실패", exc_info=e)
             raise RuntimeError(
@@ -129,7 +273,41 @@ class OiljangFormFiller:
         if mode == FieldMode.SELECT:
             self._fill_select_field_with_retry(by, locator_value, element, input_value)
         else:
-            self._fill_text_field(by, locator_value, input_value)
+            self._fill_text_field(by, locator_value, input_value, element)
+
+    def fill_many(self, specs: list[tuple[LocatorType, str, str]]) -> list[str]:
+        """
+        텍스트 필드 여러 개를 스크립트 한 번으로 채우기
+
+        요소 대기/재시도는 하지 않는다. 실패한 항목부터는 호출자가
+        fill_field(대기 + send_keys 재시도 포함)로 처리해야 함.
+
+        Args:
+            specs: (찾기 방식, 찾을 값, 입력할 값) 목록
+
+        Returns:
+            list[str]: 앞에서부터 항목별 결과 코드 ("ok", "missing", "disabled" 등).
+                처음 실패한 항목에서 멈추므로 specs보다 짧을 수 있음
+
+        Raises:
+            ValueError: 지원하지 않는 찾기 방식일 때
+            WebDriverException: 스크립트 실행 실패 시
+        """
+        payload = []
+        for locator_type, locator_value, input_value in specs:
+            by = self.LOCATOR_MAP.get(locator_type)
+            if by is None:
+                raise ValueError(f"지원하지 않는 찾기 방식: {locator_type}")
+            payload.append([by, locator_value.strip(), input_value])
+
+        self._controller.focus_active_tab()
+
+        results = self._driver.execute_script(_FILL_MANY_JS, payload)
+        logger.info(
+            "텍스트 필드 일괄 입력: %d건 중 %d건 성공",
+            len(specs), results.count("ok")
+        )
+        return results
 
     def _fill_select_field_with_retry(
         self, by, locator_value: str, element, input_value: str
@@ -140,14 +318,18 @@ class OiljangFormFiller:
         try:
             self._fill_select_field(element, input_value)
             return
+        except ValueError:
+            # 비활성화된 select/옵션: 옵션 대기로 풀리지 않으므로 바로 호출자에게 알림
+            raise
         except Exception as e:
             logger.warning("셀렉트 즉시 선택 실패, 재시도: %s", e)
 
         # 옵션 로딩 대기 후 재시도
         initial_signature = ()
         try:
-            initial_options = element.find_elements(By.TAG_NAME, "option")
-            initial_signature = self._options_signature(initial_options)
+            state = self._read_select(element)
+            if state:
+                initial_signature = self._options_signature(state["options"])
         except WebDriverException:
             pass
 
@@ -161,47 +343,38 @@ class OiljangFormFiller:
 
         self._fill_select_field(element, input_value, options)
 
-    def _fill_text_field(self, by, locator_value: str, input_value: str) -> None:
+    def _fill_text_field(
+        self, by, locator_value: str, input_value: str, element=None
+    ) -> None:
         """
         텍스트 필드 채우기 (재시도 포함)
 
+        이미 찾은 요소가 있으면 스크립트 한 번으로 먼저 채워 보고,
+        안 되면(input/textarea 아님, 비활성화, readonly, stale) 요소가 입력 가능해질 때까지
+        기다렸다가 send_keys로 재시도한다 (입력 실패 시 최대 3회).
+
         Args:
             by: Selenium By 타입
             locator_value: 찾을 값
             input_value: 입력할 값
+            element: fill_field에서 이미 찾은 요소 (없으면 바로 재시도 경로)
 
         Raises:
             RuntimeError: 3회 재시도 후에도 실패 시
         """
+        if element is not None and self._js_fill(element, input_value):
+            logger.info("텍스트 입력 성공")
+            return
+
         last_exception = None
 
         for attempt in range(1, 4):
+            # 요소가 입력 가능해질 때까지 짧은 간격으로 폴링 (고정 sleep 대신)
             try:
-                element = self._driver.find_element(by, locator_value)
-            except (NoSuchElementException, StaleElementReferenceException) as e:
+                element = self._wait_for_text_ready(by, locator_value)
+            except TimeoutException as e:
                 last_exception = e
-                logger.warning(
-                    "텍스트 요소 재탐색 실패 (시도 %s/3): %s", attempt, locator_value
-                )
-                time.sleep(0.5)
-                continue
-
-            # 활성화 상태 확인
-            if not element.is_enabled():
-                logger.info(
-                    "텍스트 요소 비활성화 (시도 %s/3): %s", attempt, locator_value
-                )
-                time.sleep(0.5)
-                continue
-
-            # readonly 확인
-            readonly = (element.get_attribute("readonly") or "").lower()
-            if readonly in {"true", "readonly"}:
-                logger.info(
-                    "텍스트 요소 readonly (시도 %s/3): %s", attempt, locator_value
-                )
-                time.sleep(0.5)
-                continue
+                break
 
             # 입력 시도
             try:
@@ -215,10 +388,68 @@ class OiljangFormFiller:
                 logger.warning(
                     "텍스트 입력 실패 (시도 %s/3): %s", attempt, e
                 )
-                time.sleep(0.5)
 
         raise RuntimeError(f"텍스트 필드 입력 실패: {last_exception}")
 
+    def _wait_for_text_ready(self, by, locator_value: str):
+        """
+        텍스트 요소가 입력 가능해질 때까지 대기 (있음 + 활성화 + readonly 아님)
+
+        폴링 한 번에 요소 찾기 + 상태 확인을 스크립트 하나로 처리한다 (왕복 1번).
+
+        Returns:
+            WebElement: 입력 가능한 요소
+
+        Raises:
+            TimeoutException: TEXT_READY_TIMEOUT_SECONDS 안에 준비되지 않을 때
+        """
+        last_reason = ["없음"]
+
+        def _condition(driver):
+            try:
+                state = driver.execute_script(_TEXT_STATE_JS, by, locator_value)
+            except WebDriverException:
+                state = None
+
+            if not state:
+                last_reason[0] = "없음"
+                return False
+            if not state["enabled"]:
+                last_reason[0] = "비활성화"
+                return False
+            if state["readonly"]:
+                last_reason[0] = "readonly"
+                return False
+            return state["element"]
+
+        try:
+            return self._text_ready_wait.until(_condition)
+        except TimeoutException:
+            logger.warning(
+                "텍스트 요소 준비 안 됨 (%s, %s초): %s",
+                last_reason[0], self.TEXT_READY_TIMEOUT_SECONDS, locator_value
+            )
+            raise
+
+    def _js_fill(self, element, input_value: str) -> bool:
+        """
+        스크립트 한 번으로 텍스트 필드 채우기
+
+        Returns:
+            bool: 성공 여부 (실패하면 호출자가 send_keys 경로로 재시도)
+        """
+        try:
+            result = self._driver.execute_script(_FILL_TEXT_JS, element, input_value)
+        except WebDriverException as e:
+            logger.info("스크립트 입력 불가, send_keys로 재시도: %s", e)
+            return False
+
+        if result != "ok":
+            logger.info("스크립트 입력 건너뜀 (%s), send_keys로 재시도", result)
+            return False
+
+        return True
+
     def _fill_select_field(
         self, element, target_value: str, options=None
     ) -> None:
@@ -230,99 +461,154 @@ class OiljangFormFiller:
         Args:
             element: select 요소
             target_value: 선택할 값
-            options: 옵션 목록 (없으면 자동 조회)
+            options: (text, value) 옵션 목록 (없으면 자동 조회)
 
         Raises:
+            ValueError: select 요소나 고른 옵션이 비활성화되어 있을 때
             RuntimeError: select 요소가 아니거나 옵션이 없을 때
         """
-        tag = element.tag_name.lower()
-        if tag != "select":
-            raise RuntimeError("셀렉트 모드인데 <select> 요소가 아님!")
-
         if options is None:
-            options = element.find_elements(By.TAG_NAME, "option")
+            state = self._read_select(element)
+            if state is None:
+                raise RuntimeError("셀렉트 모드인데 <select> 요소가 아님!")
+            options = state["options"]
         if not options:
             raise RuntimeError("선택할 옵션이 없어!")
 
         target_value = target_value.strip()
         norm_target = self._normalize_option(target_value)
 
-        # 유사도 매칭으로 최적 옵션 찾기
+        # 빈 타깃은 루프 밖에서 한 번만 판단 (옵션마다 유사도 계산 안 함)
+        if norm_target:
+            best_index, best_score, best_desc = self._best_matching_option(
+                norm_target, options
+            )
+        else:
+            best_index, best_score, best_desc = self._first_filled_option(options)
+
+        if best_index is None:
+            raise RuntimeError("선택할 옵션을 결정하지 못함!")
+
+        if norm_target and best_score < 0.5:
+            raise RuntimeError(
+                f"'{target_value}'와 비슷한 옵션을 못 찾음 (최대 유사도: {best_score:.2f})"
+            )
+
+        result = self._driver.execute_script(_SELECT_INDEX_JS, element, best_index)
+        if result == "disabled":
+            raise ValueError("비활성화된 셀렉트라 선택할 수 없어!")
+        if result == "option_disabled":
+            raise ValueError(
+                f"비활성화된 옵션이라 선택할 수 없어! (index={best_index}, label='{best_desc}')"
+            )
+        if result != "ok":
+            raise RuntimeError(f"셀렉트 선택이 반영되지 않음 ({result}, index={best_index})")
+
+        # 옵션별 점수는 DEBUG, 결과는 옵션 개수와 함께 INFO 한 줄로 요약
+        logger.info(
+            "셀렉트 선택 성공: 옵션 %d개 중 index=%s, label='%s', score=%.3f",
+            len(options), best_index, best_desc, best_score
+        )
+
+    def _best_matching_option(
+        self, norm_target: str, options: list[tuple[str, str]]
+    ) -> tuple[int | None, float, str]:
+        """
+        유사도 매칭으로 가장 비슷한 옵션 찾기
+
+        Args:
+            norm_target: 정규화된 목표 값 (비어 있지 않음)
+            options: (text, value) 옵션 목록
+
+        Returns:
+            tuple: (옵션 인덱스, 유사도, 옵션 라벨)
+        """
         best_index = None
         best_score = -1.0
         best_desc = ""
+        # 옵션별 점수 로그는 상세 로그 켰을 때만 (옵션마다 속성 조회 안 하도록 미리 묶어 둠)
+        log_option = logger.debug if is_verbose_logging() else None
 
-        for idx, option in enumerate(options):
-            text = option.text.strip()
-            value_attr = option.get_attribute("value") or ""
-            candidates = [text, value_attr]
+        for idx, (text, value_attr) in enumerate(options):
 
-            score = max(
-                self._match_score(norm_target, self._normalize_option(c))
-                for c in candidates
+            # text/value 각각 한 번만 정규화 (같으면 재사용)
+            norm_text = self._normalize_option(text)
+            norm_value = (
+                norm_text if value_attr == text else self._normalize_option(value_attr)
             )
 
-            logger.info(
-                "옵션 #%s: text='%s', value='%s', score=%.3f",
-                idx, text, value_attr, score
-            )
+            # 현재 최고점을 못 넘는 후보는 정밀 계산을 생략 (best_score를 컷오프로 전달)
+            score = self._match_score(norm_target, norm_text, best_score)
+            if norm_value != norm_text:
+                score = max(
+                    score,
+                    self._match_score(norm_target, norm_value, max(score, best_score)),
+                )
+
+            if log_option is not None:
+                log_option(
+                    "옵션 #%s: text='%s', value='%s', score=%.3f",
+                    idx, text, value_attr, score
+                )
 
             if score > best_score:
                 best_score = score
                 best_index = idx
                 best_desc = text or value_attr
 
-        if best_index is None:
-            raise RuntimeError("선택할 옵션을 결정하지 못함!")
+                # 완전 일치면 더 볼 필요 없음 (동점은 앞 옵션이 이기므로 결과 동일)
+                if best_score >= 1.0:
+                    break
 
-        if norm_target and best_score < 0.5:
-            raise RuntimeError(
-                f"'{target_value}'와 비슷한 옵션을 못 찾음 (최대 유사도: {best_score:.2f})"
-            )
+        return best_index, best_score, best_desc
 
-        select = Select(element)
-        select.select_by_index(best_index)
-        logger.info(
-            "셀렉트 선택 성공: index=%s, label='%s', score=%.3f",
-            best_index, best_desc, best_score
-        )
+    def _first_filled_option(
+        self, options: list[tuple[str, str]]
+    ) -> tuple[int, float, str]:
+        """
+        빈 타깃용: text나 value가 있는 첫 옵션 선택 (없으면 첫 옵션)
+
+        Returns:
+            tuple: (옵션 인덱스, 점수, 옵션 라벨)
+        """
+        for idx, (text, value_attr) in enumerate(options):
+            if self._normalize_option(text) or self._normalize_option(value_attr):
+                return idx, 0.1, text or value_attr
+
+        text, value_attr = options[0]
+        return 0, 0.0, text or value_attr
 
     def _wait_for_select_ready(self, by, locator_value: str, initial_signature: tuple):
         """
         셀렉트 옵션이 준비될 때까지 대기
 
+        폴링 한 번에 요소 찾기 + 상태 읽기를 스크립트 하나로 처리한다 (왕복 1번).
+
         Returns:
-            tuple: (element, options)
+            tuple: (element, (text, value) 옵션 목록)
         """
         start = time.time()
 
         def _condition(driver):
             try:
-                elem = driver.find_element(by, locator_value)
-            except (WebDriverException, StaleElementReferenceException):
+                state = driver.execute_script(_POLL_SELECT_JS, by, locator_value)
+            except WebDriverException:
                 return False
 
-            if not elem.is_enabled():
-                return False
-
-            try:
-                opts = elem.find_elements(By.TAG_NAME, "option")
-            except (WebDriverException, StaleElementReferenceException):
+            if not state:
                 return False
 
+            elem = state["element"]
+            opts = [(text, value) for text, value in state["options"]]
             if not opts:
                 return False
 
-            signature = self._options_signature(opts)
+            # 싼 검사부터 하고, 시그니처(옵션 전체 튜플)는 마지막에 필요할 때만 만든다
 
             # 초기 시그니처가 없으면 옵션이 있는 것만으로 OK
             if not initial_signature:
                 return (elem, opts)
 
-            # 시그니처가 바뀌었으면 OK
-            if signature and signature != initial_signature:
-                return (elem, opts)
-
             # 옵션 개수가 늘었으면 OK
             if len(opts) > 1 and len(initial_signature) <= 1:
                 return (elem, opts)
@@ -331,52 +617,87 @@ class OiljangFormFiller:
             if time.time() - start > 1.0:
                 return (elem, opts)
 
+            # 개수가 다르면 시그니처도 다름 (튜플을 만들 필요 없음)
+            if len(opts) != len(initial_signature):
+                return (elem, opts)
+
+            # 시그니처가 바뀌었으면 OK
+            if self._options_signature(opts) != initial_signature:
+                return (elem, opts)
+
             return False
 
-        wait = WebDriverWait(self._driver, 10)
-        return wait.until(_condition)
+        return self._element_wait.until(_condition)
+
+    def _read_select(self, element) -> dict | None:
+        """
+        select 요소의 활성화 여부와 옵션 목록을 한 번에 읽기
+
+        Returns:
+            dict | None: {"enabled": bool, "options": [(text, value), ...]},
+                select 요소가 아니면 None
+        """
+        state = self._driver.execute_script(_READ_SELECT_JS, element)
+        if state is None:
+            return None
+        state["options"] = [(text, value) for text, value in state["options"]]
+        return state
 
     @staticmethod
-    def _options_signature(options) -> tuple:
+    def _options_signature(options: list[tuple[str, str]]) -> tuple:
         """옵션 목록의 시그니처 생성 (변경 감지용)"""
-        signature = []
-        for opt in options:
-            try:
-                text = (opt.text or "").strip()
-                value_attr = (opt.get_attribute("value") or "").strip()
-            except StaleElementReferenceException:
-                continue
-            signature.append((text, value_attr))
-        return tuple(signature)
+        return tuple((text.strip(), value.strip()) for text, value in options)
 
     @staticmethod
     def _normalize_option(value: str) -> str:
         """옵션 값 정규화 (비교용)"""
         if not value:
             return ""
-        lowered = value.lower()
-        lowered = re.sub(r"\s+", "", lowered)
-        lowered = re.sub(r"[^\w가-힣]", "", lowered)
-        return lowered
+        return _NONWORD_RE.sub("", value.lower())
 
     @staticmethod
-    def _match_score(target_norm: str, candidate_norm: str) -> float:
+    def _match_score(
+        target_norm: str, candidate_norm: str, score_cutoff: float = 0.0
+    ) -> float:
         """
         두 문자열의 유사도 점수 계산
 
+        Args:
+            target_norm: 정규화된 목표 값 (비어 있지 않음, 빈 타깃은 호출자가 처리)
+            candidate_norm: 정규화된 후보 값
+            score_cutoff: 이 점수를 넘을 수 없으면 정밀 계산 없이 0.0 반환
+
         Returns:
             float: 0.0 ~ 1.0 사이의 유사도
         """
         if not candidate_norm:
             return 0.0
-        if not target_norm:
-            # 빈 타깃이면 낮은 가중치 (첫 번째 옵션 선택용)
-            return 0.1
-
-        ratio = SequenceMatcher(None, target_norm, candidate_norm).ratio()
+        if target_norm == candidate_norm:
+            return 1.0
 
         # 부분 문자열 포함 시 보너스
-        if target_norm in candidate_norm or candidate_norm in target_norm:
-            ratio += 0.2
+        contains = target_norm in candidate_norm or candidate_norm in target_norm
+        bonus = 0.2 if contains else 0.0
+
+        # 길이 차이가 크면 유사도 상한이 0.5 미만이라 계산할 필요 없음
+        shorter, longer = sorted((len(target_norm), len(candidate_norm)))
+        if not contains and shorter / longer < 0.3:
+            return 0.0
+
+        # 보너스를 더해도 컷오프를 못 넘는 비율
+        needed = max(score_cutoff - bonus, 0.0)
+
+        # rapidfuzz(C++ 구현)가 있으면 사용, 없으면 순수 파이썬 difflib
+        if fuzz is not None:
+            ratio = fuzz.ratio(target_norm, candidate_norm, score_cutoff=needed * 100) / 100.0
+        else:
+            matcher = SequenceMatcher(None, target_norm, candidate_norm)
+            # 상한값부터 보고 못 넘으면 ratio() 생략
+            if matcher.real_quick_ratio() < needed or matcher.quick_ratio() < needed:
+                return 0.0
+            ratio = matcher.ratio()
+
+        if ratio == 0.0:
+            return 0.0
 
-        return min(ratio, 1.0)
+        return min(ratio + bonus, 1.0)
@@ -2,7 +2,7 @@
 레이어: infra
 역할: 프리셋 JSON 파일 저장/로드
 의존: domain/models.py
-외부: json
+외부: json, hashlib, os, orjson (선택, 없으면 json으로 폴백)
 
 목적: 프리셋 데이터를 JSON 파일로 영속화
 
@@ -13,15 +13,47 @@
     repo.save(presets)
     loaded = repo.load()
 """
+import hashlib
 import json
+import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경: 표준 json 사용
+    orjson = None
+
 from src.features.oiljang_form_filler.domain.models import FormPreset
 from src.shared.logging.app_logger import get_logger
 
 logger = get_logger()
 
 
+def _dumps(data: list[dict]) -> bytes:
+    """프리셋 dict 목록을 JSON 바이트로 직렬화 (orjson 우선, 들여쓰기 없는 압축 형식)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> list[dict]:
+    """프리셋 파일 바이트를 dict 목록으로 역직렬화 (orjson 우선, 예전 들여쓰기 파일도 읽음)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """프리셋 파일을 임시 파일에 쓴 뒤 os.replace로 교체 (저장 중 종료돼도 기존 프리셋 유지)"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class PresetRepository:
     """
     프리셋 JSON 파일 저장/로드
@@ -40,30 +72,57 @@ class PresetRepository:
         """
         self._path = file_path or self.DEFAULT_PATH
 
-    def save(self, presets: list[FormPreset]) -> None:
+        # 마지막으로 읽거나 쓴 파일 내용의 SHA-256 (변경 없는 저장 스킵용)
+        self._last_saved_digest: bytes | None = None
+        # 그 내용을 읽거나 쓴 직후의 (st_mtime_ns, st_size): 외부에서 파일이 바뀌었는지 판별
+        self._last_saved_key: tuple[int, int] | None = None
+
+        # 파싱 결과 캐시: (st_mtime_ns, st_size)가 같으면 파일을 다시 읽지 않음
+        self._cache_key: tuple[int, int] | None = None
+        self._cache_entries: list[dict] = []
+
+    def save(self, presets: list[FormPreset]) -> bool:
         """
         프리셋 목록을 JSON으로 저장
 
+        직렬화 결과가 마지막으로 읽거나 쓴 내용과 같고, 그 뒤 파일의
+        수정 시각/크기도 그대로면 파일 쓰기를 건너뛴다.
+
         Args:
             presets: 저장할 프리셋 목록
 
+        Returns:
+            bool: 실제로 파일을 썼으면 True, 변경이 없어 건너뛰었으면 False
+
         Raises:
             OSError: 파일 저장 실패 시
         """
+        entries = [preset.to_dict() for preset in presets]
+        data = _dumps(entries)
+        digest = hashlib.sha256(data).digest()
+
+        # 내용이 같아도 그 뒤 디스크의 파일이 바뀌었으면(외부 수정/삭제) 다시 쓴다
+        if digest == self._last_saved_digest and self._stat_key() == self._last_saved_key:
+            logger.info("프리셋 변경 없음, 저장 생략: %s", self._path)
+            return False
+
         # data 폴더 생성
         self._path.parent.mkdir(parents=True, exist_ok=True)
 
-        entries = [preset.to_dict() for preset in presets]
-
-        with self._path.open("w", encoding="utf-8") as f:
-            json.dump(entries, f, ensure_ascii=False, indent=2)
+        _write_atomic(self._path, data)
+        self._last_saved_digest = digest
+        self._last_saved_key = self._stat_key()
+        self._cache_key = None
 
         logger.info("프리셋 저장 완료: %s (%d건)", self._path, len(presets))
+        return True
 
     def load(self) -> list[FormPreset]:
         """
         JSON에서 프리셋 목록 로드
 
+        파일의 수정 시각/크기가 마지막 로드 때와 같으면 캐시된 파싱 결과를 쓴다.
+
         Returns:
             list[FormPreset]: 로드된 프리셋 목록 (파일 없으면 빈 리스트)
 
@@ -74,14 +133,32 @@ class PresetRepository:
             logger.info("프리셋 파일 없음: %s", self._path)
             return []
 
-        with self._path.open("r", encoding="utf-8") as f:
-            entries = json.load(f)
+        stat = self._path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        if key == self._cache_key:
+            entries = self._cache_entries
+        else:
+            raw = self._path.read_bytes()
+            entries = _loads(raw)
+            self._last_saved_digest = hashlib.sha256(raw).digest()
+            self._last_saved_key = key
+            self._cache_key = key
+            self._cache_entries = entries
 
         presets = [FormPreset.from_dict(e) for e in entries]
         logger.info("프리셋 로드 완료: %s (%d건)", self._path, len(presets))
 
         return presets
 
+    def _stat_key(self) -> tuple[int, int] | None:
+        """파일의 (st_mtime_ns, st_size), 파일이 없으면 None"""
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def exists(self) -> bool:
         """프리셋 파일 존재 여부"""
         return self._path.exists()
@@ -7,6 +7,7 @@ DI 컨테이너 역할: 모든 의존성을 여기서 조립한다.
 """
 
 import sys
+import threading
 from PyQt5.QtWidgets import QApplication
 
 # === 이벤트 시스템 ===
@@ -45,6 +46,19 @@ from src.shared.logging.app_logger import get_logger
 
 LOGGER = get_logger()
 
+# 종료 시 드라이버 quit을 기다리는 최대 시간 (초)
+DRIVER_QUIT_TIMEOUT_SECONDS = 2.0
+
+
+def _close_crawler(crawler: SeleniumCrawler) -> None:
+    """
+    목적: 크롤러 드라이버 종료 (앱 종료 스레드에서 실행)
+    """
+    try:
+        crawler.close()
+    except Exception as exc:
+        LOGGER.warning("크롤러 종료 중 예외: %s", exc)
+
 
 def main():
     """
@@ -59,22 +73,18 @@ def main():
     # === 1. 이벤트 버스 생성 ===
     event_bus = EventBus()
 
-    # === 2. 인프라 계층 생성 ===
-    crawler = SeleniumCrawler()
+    # === 2. 설정 로드 ===
     settings_repo = SettingsRepository()
-    preset_repo = PresetRepository()
-    result_repo = ResultRepository()
-
-    # === 3. 설정 로드 ===
     settings = settings_repo.load()
     headless_mode = settings.get("headless_mode", False)
 
-    # === 4. 크롤러 초기화 (첫 실행 시 한 번만) ===
-    if not crawler.init_driver(headless=headless_mode):
-        LOGGER.error("Chrome 드라이버 초기화 실패")
-        sys.exit(1)
+    # === 3. 인프라 계층 생성 ===
+    # 크롤러 드라이버는 창 표시 후 백그라운드로 띄운다 (창이 Chrome 실행을 기다리지 않음)
+    crawler = SeleniumCrawler(headless=headless_mode)
+    preset_repo = PresetRepository()
+    result_repo = ResultRepository()
 
-    # === 5. 유즈케이스 생성 (DI) ===
+    # === 4. 유즈케이스 생성 (DI) ===
     search_uc = SearchAddressUseCase(crawler, event_bus)
     select_building_uc = SelectBuildingUseCase(crawler, event_bus)
     crawl_uc = CrawlDetailUseCase(crawler, event_bus)
@@ -82,7 +92,7 @@ def main():
     load_preset_uc = LoadPresetUseCase(preset_repo)
     save_result_uc = SaveResultUseCase(result_repo)
 
-    # === 6. GUI 생성 (유즈케이스 주입) ===
+    # === 5. GUI 생성 (유즈케이스 주입) ===
     window = SiteCrawlerMainWindow(
         search_uc=search_uc,
         select_building_uc=select_building_uc,
@@ -93,7 +103,7 @@ def main():
         settings_repo=settings_repo,
     )
 
-    # === 7. 이벤트 구독 설정 (중앙 관리) ===
+    # === 6. 이벤트 구독 설정 (중앙 관리) ===
     # 위젯의 이벤트 핸들러를 이벤트 버스에 등록
     widget = window.crawler_widget
     event_bus.subscribe(StatusEvent, widget.on_status_event)
@@ -104,18 +114,24 @@ def main():
 
     LOGGER.info("이벤트 구독 설정 완료")
 
-    # === 8. GUI 표시 ===
+    # === 7. GUI 표시 ===
     window.show()
     LOGGER.info("Site Crawler 윈도우 표시 완료")
 
-    # === 9. 앱 실행 ===
+    # 사용자가 주소를 입력하는 동안 드라이버 미리 띄우기 (실패하면 첫 검색 때 재시도)
+    crawler.warm_up()
+
+    # === 8. 앱 실행 ===
     exit_code = app.exec_()
 
-    # === 10. 정리 (앱 종료 시 드라이버 삭제) ===
-    try:
-        crawler.close()
-    except Exception as exc:
-        LOGGER.warning("크롤러 종료 중 예외: %s", exc)
+    # === 9. 정리 (앱 종료 시 드라이버 삭제) ===
+    # quit()은 chromedriver 정리를 기다리느라 수 초 걸릴 수 있어 데몬 스레드로 돌리고
+    # 최대 DRIVER_QUIT_TIMEOUT_SECONDS만 기다린다 (넘기면 프로세스 종료와 함께 정리)
+    quit_thread = threading.Thread(target=_close_crawler, args=(crawler,), daemon=True)
+    quit_thread.start()
+    quit_thread.join(timeout=DRIVER_QUIT_TIMEOUT_SECONDS)
+    if quit_thread.is_alive():
+        LOGGER.warning("드라이버 종료가 %.1f초 안에 끝나지 않아 기다리지 않고 종료", DRIVER_QUIT_TIMEOUT_SECONDS)
 
     LOGGER.info("Site Crawler 애플리케이션 종료 (exit_code=%d)", exit_code)
     sys.exit(exit_code)
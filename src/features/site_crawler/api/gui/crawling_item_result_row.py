@@ -4,6 +4,8 @@
 CrawlingItemResultRow: 제목 + 크롤링 결과 내용을 한 행으로 표시
 """
 
+from typing import Optional
+
 from PyQt5.QtWidgets import (
     QWidget,
     QHBoxLayout,
@@ -30,6 +32,9 @@ class CrawlingItemResultRow(QWidget):
         """
         super().__init__(parent)
 
+        # 컨텍스트 메뉴 (처음 우클릭할 때 한 번만 생성해서 재사용)
+        self._menu: Optional[QMenu] = None
+
         # 제목 입력 (사용자가 편집 가능)
         self.title_input = QLineEdit()
         self.title_input.setPlaceholderText("제목 입력")
@@ -68,8 +73,10 @@ class CrawlingItemResultRow(QWidget):
     def set_content(self, content: str) -> None:
         """
         목적: 내용 텍스트 설정 (크롤링 결과 표시용)
+        이유: 다시 가져오기는 대부분 같은 값이라, 같으면 setText(textChanged/다시 그리기)를 건너뜀
         """
-        self.content_input.setText(content)
+        if self.content_input.text() != content:
+            self.content_input.setText(content)
 
     def set_preset(self, title: str) -> None:
         """
@@ -77,35 +84,39 @@ class CrawlingItemResultRow(QWidget):
         """
         self.title_input.setText(title)
 
+    def _ensure_menu(self) -> QMenu:
+        """
+        목적: 컨텍스트 메뉴 생성 (최초 1회)
+        이유: 우클릭마다 QMenu(self)를 만들면 행이 삭제될 때까지 메뉴가 계속 쌓임
+        """
+        if self._menu is None:
+            self._menu = QMenu(self)
+            self._move_up_action = self._menu.addAction("위로 이동")
+            self._move_down_action = self._menu.addAction("아래로 이동")
+            self._delete_action = self._menu.addAction("삭제")
+        return self._menu
+
     def _show_context_menu(self, pos) -> None:
         """
         목적: 우클릭 컨텍스트 메뉴 표시 (위로 이동, 아래로 이동, 삭제)
         """
         global_pos = self.mapToGlobal(pos)
-        menu = QMenu(self)
-
-        move_up_action = menu.addAction("위로 이동")
-        move_down_action = menu.addAction("아래로 이동")
-        delete_action = menu.addAction("삭제")
-
-        # 첫 번째 행이면 위로 이동 비활성화
-        if self._is_first_row():
-            move_up_action.setEnabled(False)
+        menu = self._ensure_menu()
 
-        # 마지막 행이면 아래로 이동 비활성화
-        if self._is_last_row():
-            move_down_action.setEnabled(False)
+        # 첫 번째 행이면 위로 이동, 마지막 행이면 아래로 이동 비활성화
+        self._move_up_action.setEnabled(not self._is_first_row())
+        self._move_down_action.setEnabled(not self._is_last_row())
 
         # 메뉴 실행 및 액션 처리
         action = menu.exec_(global_pos)
         if action is None:
             return
 
-        if action == move_up_action:
+        if action == self._move_up_action:
             self.move_up_requested.emit(self)
-        elif action == move_down_action:
+        elif action == self._move_down_action:
             self.move_down_requested.emit(self)
-        elif action == delete_action:
+        elif action == self._delete_action:
             self.delete_requested.emit(self)
 
     def _is_first_row(self) -> bool:
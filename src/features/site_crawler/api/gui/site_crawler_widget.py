@@ -43,7 +43,7 @@ from src.features.site_crawler.app.crawl_detail_use_case import CrawlDetailUseCa
 from src.features.site_crawler.app.save_preset_use_case import SavePresetUseCase
 from src.features.site_crawler.app.load_preset_use_case import LoadPresetUseCase
 from src.features.site_crawler.app.save_result_use_case import SaveResultUseCase
-from src.shared.logging.app_logger import get_logger
+from src.shared.logging.app_logger import get_logger, is_verbose_logging
 
 LOGGER = get_logger()
 
@@ -54,6 +54,9 @@ class SiteCrawlerWidget(QWidget):
     목적: 유즈케이스와 이벤트 시스템을 통해 크롤링 인터페이스 제공
     """
 
+    # 콘솔 메시지 출력 간격 (ms) - 이 간격 안에 들어온 메시지는 한 번에 출력
+    STATUS_FLUSH_INTERVAL_MS = 50
+
     def __init__(
         self,
         parent=None,
@@ -89,12 +92,18 @@ class SiteCrawlerWidget(QWidget):
 
         # 내부 상태
         self.crawling_rows: List[CrawlingItemResultRow] = []
-        self.console_history: List[str] = []
         self.current_addresses: List[Address] = []
         self.current_buildings: List[Building] = []
         self.selected_address: str = ""
         self.selected_building: str = ""
 
+        # 콘솔 메시지 모아서 출력 (연속 메시지마다 다시 그리지 않도록)
+        self._pending_status: List[str] = []
+        self._status_flush_timer = QTimer(self)
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setInterval(self.STATUS_FLUSH_INTERVAL_MS)
+        self._status_flush_timer.timeout.connect(self._flush_status)
+
         # UI 초기화
         self._init_ui()
 
@@ -174,6 +183,8 @@ class SiteCrawlerWidget(QWidget):
         self.console = QPlainTextEdit()
         self.console.setReadOnly(True)
         self.console.setMaximumHeight(150)
+        # 50줄 제한은 Qt에 맡김 (넘치면 오래된 줄부터 자동 삭제)
+        self.console.setMaximumBlockCount(50)
         layout.addWidget(self.console)
 
         self.setLayout(layout)
@@ -196,12 +207,23 @@ class SiteCrawlerWidget(QWidget):
     def update_status(self, message: str) -> None:
         """
         목적: 콘솔에 상태 메시지 추가 (50개 제한)
+        바로 쓰지 않고 모아뒀다가 STATUS_FLUSH_INTERVAL_MS마다 한 번에 출력
+        """
+        self._pending_status.append(message)
+        # 타이머가 이미 돌고 있으면 다시 시작하지 않음 (계속 밀려서 출력이 늦어지지 않도록)
+        if not self._status_flush_timer.isActive():
+            self._status_flush_timer.start()
+
+    def _flush_status(self) -> None:
         """
-        self.console_history.append(message)
-        if len(self.console_history) > 50:
-            self.console_history = self.console_history[-50:]
+        목적: 모아둔 콘솔 메시지를 한 번에 출력
+        """
+        if not self._pending_status:
+            return
 
-        self.console.setPlainText("\n".join(self.console_history))
+        # 전체 텍스트를 다시 그리지 않고 모인 줄만 추가
+        self.console.appendPlainText("\n".join(self._pending_status))
+        self._pending_status.clear()
         self.console.verticalScrollBar().setValue(
             self.console.verticalScrollBar().maximum()
         )
@@ -225,11 +247,19 @@ class SiteCrawlerWidget(QWidget):
         목적: 주소 검색 결과 이벤트 핸들러
         """
         self.current_addresses = event.addresses
-        self.address_combo.clear()
-        self.address_combo.addItem("주소 선택")
 
-        for addr in event.addresses:
-            self.address_combo.addItem(addr.display, addr)
+        # 다시 채우는 동안 시그널/화면 갱신 차단 (clear/addItem마다 핸들러 호출·다시 그리기 방지)
+        self.address_combo.blockSignals(True)
+        self.address_combo.setUpdatesEnabled(False)
+        try:
+            self.address_combo.clear()
+            self.address_combo.addItem("주소 선택")
+
+            for addr in event.addresses:
+                self.address_combo.addItem(addr.display, addr)
+        finally:
+            self.address_combo.setUpdatesEnabled(True)
+            self.address_combo.blockSignals(False)
 
         LOGGER.info("주소 콤보박스 업데이트: %d개", len(event.addresses))
 
@@ -245,7 +275,9 @@ class SiteCrawlerWidget(QWidget):
         self.current_buildings = event.buildings
 
         # 시그널 차단하여 addItem 시 currentIndexChanged 방지
+        # 화면 갱신도 멈춰서 항목 N개를 넣는 동안 다시 그리기는 끝에서 한 번만
         self.building_combo.blockSignals(True)
+        self.building_combo.setUpdatesEnabled(False)
         try:
             self.building_combo.clear()
 
@@ -272,7 +304,8 @@ class SiteCrawlerWidget(QWidget):
                 self.building_combo.setEnabled(True)
                 LOGGER.info("건물 콤보박스 업데이트: %d개", len(event.buildings))
         finally:
-            # 시그널 복원
+            # 화면 갱신/시그널 복원
+            self.building_combo.setUpdatesEnabled(True)
             self.building_combo.blockSignals(False)
 
         # 건물 1개일 때: 비동기로 자동 크롤링
@@ -298,24 +331,42 @@ class SiteCrawlerWidget(QWidget):
         """
         목적: 크롤링 완료 이벤트 핸들러
         """
+        # 제목 → 항목 인덱스 (중복 제목은 첫 번째 항목 우선)
+        # 이유: 행마다 전체 항목을 훑는 O(행×항목) 탐색을 해시 조회 1번으로 줄인다
+        items_by_title: Dict[str, CrawlItem] = {}
+        for item in event.items:
+            items_by_title.setdefault(item.title, item)
+
         # 각 크롤 행의 내용 업데이트 (제목 매칭)
-        for crawl_row in self.crawling_rows:
-            title = crawl_row.get_title()
-            if not title:
-                continue
-
-            # 정확히 일치하는 제목 찾기
-            found = False
-            for item in event.items:
-                if item.title == title:
-                    crawl_row.set_content(item.content)
-                    LOGGER.info("크롤 행 '%s' 내용 설정: %s", title, item.content)
-                    found = True
-                    break
-
-            if not found:
-                crawl_row.set_content("항목 없음")
-                LOGGER.warning("크롤 행 '%s': 매칭되는 항목 없음", title)
+        # 행별 로그는 상세 로그 켰을 때만, 매칭 실패는 경고 한 줄로 모아서 남김
+        log_each = is_verbose_logging()
+        matched_count = 0
+        unmatched_titles: List[str] = []
+        # 행마다 다시 그리지 않도록 화면 갱신을 멈췄다가 끝에서 한 번만 그림
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            for crawl_row in self.crawling_rows:
+                title = crawl_row.get_title()
+                if not title:
+                    continue
+
+                # 정확히 일치하는 제목 찾기
+                item = items_by_title.get(title)
+                if item is None:
+                    crawl_row.set_content("항목 없음")
+                    unmatched_titles.append(title)
+                    continue
+
+                crawl_row.set_content(item.content)
+                matched_count += 1
+                if log_each:
+                    LOGGER.debug("크롤 행 '%s' 내용 설정: %s", title, item.content)
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
+
+        LOGGER.info("크롤 행 내용 설정 완료: %d개", matched_count)
+        if unmatched_titles:
+            LOGGER.warning("매칭되는 항목 없는 크롤 행: %s", ", ".join(unmatched_titles))
 
         # JSON 저장 (SaveResultUseCase 호출)
         if self.save_result_uc:
@@ -432,9 +483,9 @@ class SiteCrawlerWidget(QWidget):
         """
         목적: 행을 위로 이동
         """
-        try:
-            index = self.crawling_rows.index(row)
-        except ValueError:
+        # 스크롤 레이아웃에는 크롤링 행만 들어 있어 레이아웃 순서 == crawling_rows 순서
+        index = self.scroll_layout.indexOf(row)
+        if index < 0:
             return
 
         if index <= 0:
@@ -446,9 +497,13 @@ class SiteCrawlerWidget(QWidget):
             self.crawling_rows[index],
         )
 
-        # 레이아웃에서 제거 후 재추가
-        self.scroll_layout.removeWidget(row)
-        self.scroll_layout.insertWidget(index - 1, row)
+        # 레이아웃에서 제거 후 재추가 (화면 갱신을 멈춰 다시 그리기는 한 번만)
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            self.scroll_layout.removeWidget(row)
+            self.scroll_layout.insertWidget(index - 1, row)
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
 
         LOGGER.info("행 위로 이동: %d → %d", index, index - 1)
 
@@ -456,9 +511,9 @@ class SiteCrawlerWidget(QWidget):
         """
         목적: 행을 아래로 이동
         """
-        try:
-            index = self.crawling_rows.index(row)
-        except ValueError:
+        # 스크롤 레이아웃에는 크롤링 행만 들어 있어 레이아웃 순서 == crawling_rows 순서
+        index = self.scroll_layout.indexOf(row)
+        if index < 0:
             return
 
         if index >= len(self.crawling_rows) - 1:
@@ -470,9 +525,13 @@ class SiteCrawlerWidget(QWidget):
             self.crawling_rows[index],
         )
 
-        # 레이아웃에서 제거 후 재추가
-        self.scroll_layout.removeWidget(row)
-        self.scroll_layout.insertWidget(index + 1, row)
+        # 레이아웃에서 제거 후 재추가 (화면 갱신을 멈춰 다시 그리기는 한 번만)
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            self.scroll_layout.removeWidget(row)
+            self.scroll_layout.insertWidget(index + 1, row)
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
 
         LOGGER.info("행 아래로 이동: %d → %d", index, index + 1)
 
@@ -480,18 +539,34 @@ class SiteCrawlerWidget(QWidget):
         """
         목적: 행 삭제
         """
-        try:
-            index = self.crawling_rows.index(row)
-        except ValueError:
+        # 스크롤 레이아웃에는 크롤링 행만 들어 있어 레이아웃 순서 == crawling_rows 순서
+        index = self.scroll_layout.indexOf(row)
+        if index < 0:
             return
 
         # 리스트와 레이아웃에서 제거
-        self.crawling_rows.remove(row)
+        self.crawling_rows.pop(index)
         self.scroll_layout.removeWidget(row)
         row.deleteLater()
 
         LOGGER.info("행 삭제 (인덱스: %d, 남은 행: %d개)", index, len(self.crawling_rows))
 
+    def _clear_crawling_rows(self) -> None:
+        """
+        목적: 크롤링 행 일괄 삭제
+        행마다 _delete_row를 부르면 indexOf + 앞에서 pop이 반복되므로 한 번에 떼어낸다.
+        호출자가 화면 갱신을 멈춘 상태에서 부르면 다시 그리기는 끝에서 한 번만 일어난다.
+        """
+        for row in self.crawling_rows:
+            self.scroll_layout.removeWidget(row)
+            # 부모는 그대로 두고 숨기기만 (setParent(None)은 행마다 부모 변경 이벤트가 생김)
+            # deleteLater가 처리되기 전까지 옛 위치에 그려지지 않도록
+            row.hide()
+            row.deleteLater()
+
+        LOGGER.info("크롤링 행 일괄 삭제 (%d개)", len(self.crawling_rows))
+        self.crawling_rows.clear()
+
     def _save_preset(self) -> None:
         """
         목적: 크롤링 행 제목 프리셋 저장
@@ -528,15 +603,19 @@ class SiteCrawlerWidget(QWidget):
                 self.update_status("프리셋이 비어 있습니다.")
                 return
 
-            # 기존 행 모두 삭제
-            for row in self.crawling_rows[:]:
-                self._delete_row(row)
-
-            # 프리셋 데이터로 행 추가
-            for title in titles:
-                self._add_crawling_row()
-                row = self.crawling_rows[-1]
-                row.set_preset(title)
+            # 행 교체 동안 화면 갱신 중지 (다시 그리기는 끝에서 한 번만)
+            self.scroll_content.setUpdatesEnabled(False)
+            try:
+                # 기존 행 모두 삭제
+                self._clear_crawling_rows()
+
+                # 프리셋 데이터로 행 추가
+                for title in titles:
+                    self._add_crawling_row()
+                    row = self.crawling_rows[-1]
+                    row.set_preset(title)
+            finally:
+                self.scroll_content.setUpdatesEnabled(True)
 
             self.update_status(f"프리셋 불러오기 완료: {len(titles)}개 항목")
 
@@ -5,6 +5,7 @@ webdriver-manager 라이브러리를 사용해 feature 내부 drivers/ 폴더에
 다른 feature와 driver를 공유하지 않으며, 시스템 PATH 설정이 불필요하다.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -14,27 +15,28 @@ from src.shared.logging.app_logger import get_logger
 
 LOGGER = get_logger()
 
+# 크롤러 전용 Chrome 프로필 경로 (feature 폴더 기준)
+PROFILE_DIR = Path(__file__).parent.parent / "data" / "profiles" / "crawler-profile"
 
-def get_chrome_driver(headless: bool = False) -> webdriver.Chrome:
+
+@lru_cache(maxsize=2)
+def _build_options(headless: bool) -> webdriver.ChromeOptions:
     """
-    목적: ChromeDriver를 자동으로 다운로드하고 설정된 옵션으로 반환
+    목적: Chrome 옵션 생성 (헤드리스 여부별로 한 번만 만들고 재사용)
+    프로필 디렉토리 생성도 여기서 한 번만 수행 (재연결 때마다 mkdir 하지 않도록)
 
     Args:
-        headless: 헤드리스 모드 활성화 여부 (기본값: False)
+        headless: 헤드리스 모드 활성화 여부
 
     Returns:
-        설정이 완료된 Chrome WebDriver 인스턴스
+        설정이 완료된 ChromeOptions
     """
-    # 프로필 디렉토리 경로 설정 (feature 폴더 기준으로 상대 경로 조정)
-    feature_dir = Path(__file__).parent.parent  # infra 폴더에서 한 단계 위로
-    profile_dir = feature_dir / "data" / "profiles" / "crawler-profile"
-    profile_dir.mkdir(parents=True, exist_ok=True)
-
-    LOGGER.info("Chrome 프로필 디렉토리: %s", profile_dir)
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    LOGGER.info("Chrome 프로필 디렉토리: %s", PROFILE_DIR)
 
     # Chrome 옵션 설정
     options = webdriver.ChromeOptions()
-    options.add_argument(f"user-data-dir={profile_dir}")
+    options.add_argument(f"user-data-dir={PROFILE_DIR}")
 
     if headless:
         LOGGER.info("헤드리스 모드 활성화")
@@ -52,6 +54,21 @@ def get_chrome_driver(headless: bool = False) -> webdriver.Chrome:
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
 
+    return options
+
+
+def get_chrome_driver(headless: bool = False) -> webdriver.Chrome:
+    """
+    목적: ChromeDriver를 자동으로 다운로드하고 설정된 옵션으로 반환
+
+    Args:
+        headless: 헤드리스 모드 활성화 여부 (기본값: False)
+
+    Returns:
+        설정이 완료된 Chrome WebDriver 인스턴스
+    """
+    options = _build_options(headless)
+
     # ChromeDriver 자동 다운로드 및 설치
     # webdriver-manager는 기본 캐시 디렉토리에 저장됨 (~/.wdm/)
     LOGGER.info("ChromeDriver 다운로드 시작")
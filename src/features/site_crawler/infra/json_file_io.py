@@ -0,0 +1,72 @@
+"""
+목적: site_crawler 저장소들이 함께 쓰는 JSON 파일 읽기/쓰기 도우미
+설정/프리셋/결과 저장소(infra/*_repository.py)가 같은 직렬화 형식과
+원자적 쓰기를 쓰도록 한곳에 모아 둔다.
+
+feature 내부 전용이다 (다른 feature는 import하지 말 것, shared 승격 기준 미달).
+orjson이 있으면 사용하고, 없으면 표준 json으로 폴백한다 (파일 형식 동일).
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경: 표준 json 사용
+    orjson = None
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    목적: JSON 바이트로 직렬화 (들여쓰기 없는 압축 형식)
+
+    Args:
+        data: 직렬화할 데이터 (dict/list, 키가 문자열이 아니어도 됨)
+
+    Returns:
+        UTF-8 JSON 바이트
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads_json(raw: bytes) -> Any:
+    """
+    목적: JSON 바이트 역직렬화
+
+    Args:
+        raw: 파일에서 읽은 바이트 (들여쓰기 있는 예전 파일도 가능)
+
+    Returns:
+        파싱된 데이터
+
+    Raises:
+        json.JSONDecodeError: 파싱 실패 시 (orjson.JSONDecodeError도 이 하위 클래스)
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    목적: 임시 파일에 쓴 뒤 os.replace로 교체
+    쓰는 도중 앱이 죽어도 기존 파일은 잘리지 않고 그대로 남는다.
+
+    Args:
+        path: 대상 파일 경로
+        data: 쓸 바이트
+
+    Raises:
+        OSError: 쓰기/교체 실패 시 (임시 파일은 지운 뒤 다시 올림)
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
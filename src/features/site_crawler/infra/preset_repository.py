@@ -3,9 +3,12 @@
 크롤링 행 제목 프리셋을 JSON 파일로 관리한다.
 """
 
+import hashlib
 import json
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from src.features.site_crawler.infra.json_file_io import dumps_json, loads_json, write_atomic
 
 
 class PresetRepository:
@@ -20,6 +23,15 @@ class PresetRepository:
         """
         self.preset_path = self._get_preset_path()
 
+        # 마지막으로 읽거나 쓴 파일 내용의 SHA-256 (변경 없는 저장 스킵용)
+        self._last_saved_digest: Optional[bytes] = None
+        # 그 내용을 읽거나 쓴 직후의 (st_mtime_ns, st_size): 외부에서 파일이 바뀌었는지 판별
+        self._last_saved_key: Optional[tuple] = None
+
+        # 파싱 결과 캐시: (st_mtime_ns, st_size)가 같으면 파일을 다시 읽지 않음
+        self._cache_key: Optional[tuple] = None
+        self._cache_data: List[Dict[str, Any]] = []
+
     def _get_preset_path(self) -> Path:
         """
         목적: 프리셋 파일 경로 반환
@@ -32,6 +44,19 @@ class PresetRepository:
         presets_dir.mkdir(parents=True, exist_ok=True)
         return presets_dir / "crawl_presets.json"
 
+    def _stat_key(self) -> Optional[tuple]:
+        """
+        목적: 파일의 (st_mtime_ns, st_size) 반환
+
+        Returns:
+            변경 판별용 키 (파일이 없으면 None)
+        """
+        try:
+            stat = self.preset_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def load(self) -> List[Dict[str, Any]]:
         """
         목적: 프리셋 불러오기
@@ -43,8 +68,18 @@ class PresetRepository:
             return []
 
         try:
-            with open(self.preset_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            stat = self.preset_path.stat()
+            key = (stat.st_mtime_ns, stat.st_size)
+
+            if key != self._cache_key:
+                raw = self.preset_path.read_bytes()
+                self._cache_data = loads_json(raw)
+                self._last_saved_digest = hashlib.sha256(raw).digest()
+                self._last_saved_key = key
+                self._cache_key = key
+
+            # 호출자가 수정해도 캐시가 오염되지 않도록 복사본 반환
+            return [dict(item) for item in self._cache_data]
         except (json.JSONDecodeError, IOError) as exc:
             # 파일이 손상되었거나 읽을 수 없는 경우 빈 리스트 반환
             print(f"프리셋 파일 로드 실패: {exc}")
@@ -52,10 +87,19 @@ class PresetRepository:
 
     def save(self, preset_data: List[Dict[str, Any]]) -> None:
         """
-        목적: 프리셋 저장
+        목적: 프리셋 저장 (마지막으로 읽거나 쓴 내용과 같으면 쓰기 생략)
 
         Args:
             preset_data: 저장할 프리셋 데이터 리스트
         """
-        with open(self.preset_path, "w", encoding="utf-8") as f:
-            json.dump(preset_data, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+        data = dumps_json(preset_data)
+        digest = hashlib.sha256(data).digest()
+
+        # 마지막 상태와 내용이 같고 그 뒤 디스크의 파일도 그대로면 쓰기 생략
+        if digest == self._last_saved_digest and self._stat_key() == self._last_saved_key:
+            return
+
+        write_atomic(self.preset_path, data)
+        self._last_saved_digest = digest
+        self._last_saved_key = self._stat_key()
+        self._cache_key = None
\ No newline at end of file
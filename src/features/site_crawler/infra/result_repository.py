@@ -3,9 +3,10 @@
 크롤링 결과를 JSON 파일로 저장한다.
 """
 
-import json
 from pathlib import Path
+
 from src.features.site_crawler.domain.models import CrawlResult
+from src.features.site_crawler.infra.json_file_io import dumps_json, write_atomic
 
 
 class ResultRepository:
@@ -56,7 +57,6 @@ class ResultRepository:
         file_path = self.results_dir / "latest_crawl.json"
 
         # JSON 파일로 저장
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(result_data, f, ensure_ascii=False, indent=2)
+        write_atomic(file_path, dumps_json(result_data))
 
         return file_path
\ No newline at end of file
@@ -6,24 +6,136 @@
 - 메서드 분리: select_address() + get_buildings()
 """
 
-import time
+import threading
 from typing import Optional
 from selenium import webdriver
 from selenium.common.exceptions import (
     WebDriverException,
     NoSuchElementException,
+    StaleElementReferenceException,
     TimeoutException,
 )
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from src.features.site_crawler.infra.chrome_driver_manager import get_chrome_driver
 from src.features.site_crawler.domain.models import Address, Building, CrawlItem
-from src.shared.logging.app_logger import get_logger
+from src.shared.logging.app_logger import get_logger, is_verbose_logging
 
 LOGGER = get_logger()
 
+# disco.re 요소 locator (호출마다 튜플을 새로 만들지 않도록 모듈 상수로 둠)
+WELCOME_BUTTON_LOCATOR = (By.CSS_SELECTOR, ".disco-welcome-button.disco-welcome-block")
+FOOT_BACK_BUTTON_LOCATOR = (By.ID, "foot_back_btn")
+BACK_IMAGE_LOCATOR = (By.CSS_SELECTOR, 'img[src*="back"]')
+SEARCH_BUTTON_LOCATOR = (By.ID, "dsv_search_btn")
+SEARCH_INPUT_LOCATOR = (By.ID, "top_search_ds_input")
+SUGGESTIONS_CONTAINER_LOCATOR = (By.CLASS_NAME, "ds-autocomplete-suggestions")
+SUGGESTION_ITEM_LOCATOR = (By.CLASS_NAME, "autocomplete-suggestion")
+BUILDING_TAB_LOCATOR = (By.ID, "dp_navi_4")
+BUILDING_ITEM_LOCATOR = (By.CLASS_NAME, "ddiv-build-content")
+DETAIL_TAB_LOCATOR = (By.CLASS_NAME, "mfs-agent-main-tab-div")
+# 목록 갱신 대기용 항목 선택자
+SUGGESTION_ITEMS_CSS = ".ds-autocomplete-suggestions .autocomplete-suggestion"
+SUGGESTIONS_CONTAINER_CSS = ".ds-autocomplete-suggestions"
+BUILDING_ITEMS_CSS = ".ddiv-build-content"
+
+# 페이지에서 실행할 JavaScript (호출마다 문자열을 새로 만들지 않도록 모듈 상수로 둠)
+# 자동완성 항목별 data-index/전체 텍스트/sub-value (arguments[0]: 자동완성 컨테이너)
+_SUGGESTIONS_JS = """
+    return Array.from(arguments[0].querySelectorAll('.autocomplete-suggestion'))
+        .map(elem => {
+            const subElem = elem.querySelector('.sub-value');
+            return {
+                data_index: elem.getAttribute('data-index'),
+                full: (elem.innerText || elem.textContent || '').trim(),
+                sub: subElem
+                    ? (subElem.innerText || subElem.textContent || '').trim()
+                    : null
+            };
+        });
+"""
+
+# 건물별 요소/top/bottom/title (top/bottom이 없으면 null)
+_BUILDINGS_JS = """
+    const text = (parent, cls) => {
+        const el = parent.querySelector('.' + cls);
+        if (!el) return null;
+        return (el.textContent || el.innerText || '').trim();
+    };
+    return Array.from(document.querySelectorAll('.ddiv-build-content'))
+        .map(div => {
+            return {
+                element: div,
+                top: text(div, 'ddiv-build-content-top'),
+                bottom: text(div, 'ddiv-build-content-bottom'),
+                title: text(div, 'ddiv-build-content-title') || ''
+            };
+        });
+"""
+
+# 목록 상태 (arguments[0]: 항목 CSS 선택자, arguments[1]: 이전 목록의 첫 항목 또는 null)
+# 이전 첫 항목이 stale이면 Selenium이 실행 전에 StaleElementReferenceException을 던짐
+_LIST_STATE_JS = """
+    const items = document.querySelectorAll(arguments[0]);
+    const prev = arguments[1];
+    const containerCss = arguments[2];
+    const input = arguments[3];
+    const container = containerCss ? document.querySelector(containerCss) : null;
+    return {
+        first: items.length ? items[0] : null,
+        count: items.length,
+        text: Array.from(items, el => el.textContent || '').join('\\n'),
+        prev_attached: prev ? prev.isConnected : false,
+        visible: containerCss
+            ? !!(container && container.getClientRects().length
+                 && getComputedStyle(container).visibility !== 'hidden')
+            : true,
+        ajax_idle: (window.jQuery && typeof window.jQuery.active === 'number')
+            ? window.jQuery.active === 0 : null,
+        input_value: input ? input.value : null
+    };
+"""
+
+# 상세 정보 항목별 제목/내용
+# 결과는 [제목, 내용] 쌍 배열 (객체 키를 매 항목 직렬화하지 않도록)
+_CRAWL_JS = """
+    return Array.from(document.querySelectorAll('.mfs-agent-main-tab-div'))
+        .map(div => {
+            // ifs-tab-txt 요소는 한 번만 모아서 재사용 (항목마다 querySelector 반복 방지)
+            const tabTxts = div.getElementsByClassName('ifs-tab-txt');
+            const titleElem = tabTxts[0];
+
+            // 오른쪽 div 찾기 - 방법1: rfc-dusk 클래스, 방법2: 두 번째 ifs-tab-txt 요소
+            let rightDiv = null;
+            for (const tab of tabTxts) {
+                if (tab.classList.contains('rfc-dusk')) {
+                    rightDiv = tab;
+                    break;
+                }
+            }
+            if (!rightDiv && tabTxts.length >= 2) {
+                rightDiv = tabTxts[1];
+            }
+
+            let content = '값 없음';
+
+            if (rightDiv) {
+                const contentElem = rightDiv.querySelector('span[id]') ||
+                                   rightDiv.getElementsByTagName('span')[0];
+
+                if (contentElem && contentElem.textContent.trim()) {
+                    content = contentElem.textContent.trim();
+                }
+            }
+
+            return [titleElem ? titleElem.textContent.trim() : '', content];
+        })
+        .filter(pair => pair[0]);
+"""
+
 
 class SeleniumCrawler:
     """
@@ -31,11 +143,37 @@ class SeleniumCrawler:
     목적: 상태 없는 순수 크롤링 로직 제공
     """
 
-    def __init__(self):
+    # 목록 갱신/안정화 확인 간격 (초)
+    LIST_POLL_SECONDS = 0.05
+    # 뒤로가기 버튼 확인 간격 (초) - 기본 0.5초면 0.3초 대기 동안 한 번밖에 확인 못 함
+    BACK_BUTTON_POLL_SECONDS = 0.05
+    # 주소 검색/선택 대기 확인 간격 (초) - 기본 0.5초보다 짧게 해서 요소가 뜨면 바로 진행
+    SEARCH_POLL_SECONDS = 0.1
+    # 상세 페이지 대기 확인 간격 (초) - 페이지가 빨리 뜨면 최대 0.5초 늦게 진행하던 것을 줄임
+    DETAIL_POLL_SECONDS = 0.1
+    # 웰컴 팝업 대기 시간 (초) - 팝업이 없으면 매번 이만큼 기다리므로 짧게 둠
+    WELCOME_POPUP_TIMEOUT_SECONDS = 1
+
+    def __init__(self, headless: bool = False):
         """
         목적: 크롤러 초기화
+        드라이버는 여기서 띄우지 않고 warm_up() 또는 첫 검색 때 띄운다
+        (창 표시가 Chrome 실행을 기다리지 않도록).
+
+        Args:
+            headless: 지연 초기화 시 사용할 헤드리스 모드 여부
         """
         self.driver: Optional[webdriver.Chrome] = None
+        self.headless = headless
+        # get_buildings가 찾은 건물 요소 (select_building에서 재조회 없이 사용)
+        self._building_elements: list[WebElement] = []
+        # 검색 흐름에서 반복 사용하는 대기 객체 (드라이버 초기화 때 한 번 생성)
+        self._search_wait: Optional[WebDriverWait] = None
+        self._back_button_wait: Optional[WebDriverWait] = None
+        # 미리 띄우기(warm_up)와 첫 검색이 겹쳐도 드라이버를 한 번만 만들도록 잠금
+        self._driver_lock = threading.Lock()
+        # close()가 불렸는지 (드라이버를 띄우는 중이면 띄운 스레드가 보고 직접 종료)
+        self._closed = threading.Event()
 
     def init_driver(self, headless: bool = False) -> bool:
         """
@@ -50,6 +188,15 @@ class SeleniumCrawler:
         try:
             LOGGER.info("Chrome 드라이버 초기화 중...")
             self.driver = get_chrome_driver(headless=headless)
+            if self._closed.is_set():
+                # 띄우는 동안 close()가 불림: 사이트 접속 없이 호출자(_ensure_driver)가 정리
+                return False
+            self._search_wait = WebDriverWait(
+                self.driver, 4, poll_frequency=self.SEARCH_POLL_SECONDS
+            )
+            self._back_button_wait = WebDriverWait(
+                self.driver, 0.3, poll_frequency=self.BACK_BUTTON_POLL_SECONDS
+            )
 
             # disco.re 사이트로 이동
             self.driver.get("https://disco.re")
@@ -66,6 +213,51 @@ class SeleniumCrawler:
             self.driver = None
             return False
 
+    def _ensure_driver(self) -> None:
+        """
+        목적: 드라이버가 없으면 그때 초기화 (지연 초기화)
+
+        Raises:
+            RuntimeError: 드라이버 초기화에 실패했거나 이미 close()가 불렸을 때
+        """
+        with self._driver_lock:
+            if self._closed.is_set():
+                raise RuntimeError("크롤러가 이미 종료되었습니다.")
+            if self.driver:
+                return
+
+            initialized = self.init_driver(headless=self.headless)
+
+            # 띄우는 동안 close()가 불렸으면 close는 기다리지 않고 돌아갔으므로 여기서 종료
+            if self._closed.is_set():
+                self._quit_driver()
+                raise RuntimeError("크롤러가 이미 종료되었습니다.")
+
+            if not initialized:
+                raise RuntimeError("Chrome 드라이버 초기화에 실패했습니다.")
+
+    def warm_up(self) -> None:
+        """
+        목적: 백그라운드 스레드에서 드라이버를 미리 띄움
+        창이 뜬 뒤 사용자가 주소를 입력하는 동안 Chrome 실행/disco.re 접속을 끝내 둔다.
+        실패해도 첫 검색 때 다시 시도하므로 로그만 남긴다.
+
+        데몬 스레드가 아니다: 띄우는 중에 앱이 종료되면 인터프리터가 이 스레드를
+        기다리고, 스레드는 Chrome이 뜨자마자 close() 여부를 보고 직접 종료한다
+        (데몬이면 실행 중이던 Chrome이 정리되지 않고 남음).
+        """
+
+        def run() -> None:
+            try:
+                self._ensure_driver()
+            except Exception as exc:
+                if self._closed.is_set():
+                    LOGGER.info("미리 띄우는 중 종료 요청, 드라이버 정리 완료")
+                else:
+                    LOGGER.warning("드라이버 미리 띄우기 실패 (첫 검색 때 다시 시도): %s", exc)
+
+        threading.Thread(target=run, name="crawler-warm-up").start()
+
     def _handle_welcome_popup(self) -> None:
         """
         목적: disco.re 웰컴 팝업 처리 (오늘 하루 안볼래요 클릭)
@@ -73,14 +265,15 @@ class SeleniumCrawler:
         if not self.driver:
             return
 
+        # 웰컴 팝업 버튼 대기 (페이지 로드 직후라 있으면 바로 잡힘)
+        wait = WebDriverWait(
+            self.driver,
+            self.WELCOME_POPUP_TIMEOUT_SECONDS,
+            poll_frequency=self.SEARCH_POLL_SECONDS,
+        )
+
         try:
-            # 최대 2초 동안 웰컴 팝업 버튼 대기
-            wait = WebDriverWait(self.driver, 2)
-            welcome_button = wait.until(
-                EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, ".disco-welcome-button.disco-welcome-block")
-                )
-            )
+            welcome_button = wait.until(EC.element_to_be_clickable(WELCOME_BUTTON_LOCATOR))
 
             # 버튼 텍스트 확인
             button_text = welcome_button.text.strip()
@@ -88,7 +281,7 @@ class SeleniumCrawler:
                 # JavaScript로 클릭
                 self.driver.execute_script("arguments[0].click();", welcome_button)
                 LOGGER.info("웰컴 팝업 '오늘 하루 안볼래요' 클릭 완료")
-                time.sleep(0.5)
+                self._wait_welcome_popup_closed(wait)
             else:
                 LOGGER.warning("예상치 못한 버튼 텍스트: %s", button_text)
 
@@ -99,6 +292,18 @@ class SeleniumCrawler:
         except Exception as exc:
             LOGGER.warning("웰컴 팝업 처리 중 예외 발생: %s", exc)
 
+    def _wait_welcome_popup_closed(self, wait: WebDriverWait) -> None:
+        """
+        목적: 웰컴 팝업이 닫힐 때까지만 대기 (고정 0.5초 sleep 대신)
+
+        Args:
+            wait: 팝업 대기에 쓴 WebDriverWait
+        """
+        try:
+            wait.until(EC.invisibility_of_element_located(WELCOME_BUTTON_LOCATOR))
+        except TimeoutException:
+            LOGGER.warning("웰컴 팝업이 닫히지 않음 (그대로 진행)")
+
     def search_address(self, address: str) -> list[Address]:
         """
         목적: 주소 검색 및 자동완성 목록 반환 (상태 저장 안 함)
@@ -110,83 +315,199 @@ class SeleniumCrawler:
             Address 엔티티 리스트
 
         Raises:
-            RuntimeError: 크롤러가 초기화되지 않았을 때
+            RuntimeError: 드라이버 초기화에 실패했을 때
             TimeoutException: 요소를 찾을 수 없을 때
         """
-        if not self.driver:
-            raise RuntimeError("크롤러가 초기화되지 않았습니다.")
+        # 첫 검색이면 여기서 Chrome을 띄운다
+        self._ensure_driver()
 
         LOGGER.info("주소 검색 시작: %s", address)
 
+        # 새 검색이면 이전 건물 요소는 더 이상 쓰지 않음
+        self._building_elements = []
+
         # 뒤로가기 버튼 순차 확인 및 처리
         self._handle_back_buttons()
 
         # 주소검색 버튼 찾기 및 클릭
-        wait = WebDriverWait(self.driver, 4)
-        dsv_search_btn = wait.until(
-            EC.element_to_be_clickable((By.ID, "dsv_search_btn"))
-        )
+        wait = self._search_wait
+        dsv_search_btn = wait.until(EC.element_to_be_clickable(SEARCH_BUTTON_LOCATOR))
         self.driver.execute_script("arguments[0].click();", dsv_search_btn)
         LOGGER.info("dsv_search_btn 클릭 완료")
 
         # 주소 입력 필드에 입력
-        address_input = wait.until(
-            EC.element_to_be_clickable((By.ID, "top_search_ds_input"))
+        address_input = wait.until(EC.element_to_be_clickable(SEARCH_INPUT_LOCATOR))
+        # 이전 검색의 자동완성 목록과 입력값 (새 목록으로 바뀌었는지 판단용)
+        previous_suggestions = self._snapshot_list(
+            SUGGESTION_ITEMS_CSS, SUGGESTIONS_CONTAINER_CSS, address_input
         )
         address_input.clear()
         address_input.send_keys(address)
         LOGGER.info("주소 입력 완료: %s", address)
 
-        # 자동완성 생성 대기
-        time.sleep(0.5)
+        # 자동완성 생성 대기 (이전 목록이 바뀐 뒤 새 목록이 안정될 때까지)
+        try:
+            count = self._wait_for_list_refresh(
+                SUGGESTION_ITEMS_CSS, previous_suggestions, 2,
+                SUGGESTIONS_CONTAINER_CSS, address_input,
+            )
+            if not count:
+                LOGGER.info("자동완성 항목이 나타나지 않음 (검색 결과 없음)")
+        except TimeoutException:
+            LOGGER.info("자동완성 목록이 2초 안에 갱신되지 않음 (현재 목록으로 진행)")
 
         # 자동완성 목록 파싱
         suggestions_container = wait.until(
-            EC.presence_of_element_located(
-                (By.CLASS_NAME, "ds-autocomplete-suggestions")
-            )
+            EC.presence_of_element_located(SUGGESTIONS_CONTAINER_LOCATOR)
         )
 
-        suggestion_elements = suggestions_container.find_elements(
-            By.CLASS_NAME, "autocomplete-suggestion"
+        # 항목별 텍스트/sub-value/data-index를 JavaScript 한 번으로 가져오기
+        # 이유: 항목마다 .text, find_element, get_attribute를 부르면 항목 수 x 3번 왕복이 생김
+        suggestion_data = (
+            self.driver.execute_script(_SUGGESTIONS_JS, suggestions_container) or []
         )
-        LOGGER.info("자동완성 항목 %d개 발견", len(suggestion_elements))
+        LOGGER.info("자동완성 항목 %d개 발견", len(suggestion_data))
 
         # Address 엔티티 생성 (지역 변수)
         addresses = []
-        for elem in suggestion_elements:
-            try:
-                full_text = elem.text.strip()
-                sub_value_elem = elem.find_element(By.CLASS_NAME, "sub-value")
-                sub_value_text = sub_value_elem.text.strip()
-                main_address = full_text.replace(sub_value_text, "").strip()
+        for data in suggestion_data:
+            full_text = data["full"]
+            sub_value_text = data["sub"]
 
-                data_index = elem.get_attribute("data-index")
-                addresses.append(
-                    Address(
-                        data_index=data_index,
-                        main=main_address,
-                        sub=sub_value_text,
-                        display=f"{main_address} / {sub_value_text}",
-                    )
-                )
-
-            except NoSuchElementException:
+            if sub_value_text is None:
                 # sub-value 없는 경우
-                main_address = elem.text.strip()
-                data_index = elem.get_attribute("data-index")
                 addresses.append(
                     Address(
-                        data_index=data_index,
-                        main=main_address,
+                        data_index=data["data_index"],
+                        main=full_text,
                         sub="",
-                        display=main_address,
+                        display=full_text,
                     )
                 )
+                continue
+
+            main_address = full_text.replace(sub_value_text, "").strip()
+            addresses.append(
+                Address(
+                    data_index=data["data_index"],
+                    main=main_address,
+                    sub=sub_value_text,
+                    display=f"{main_address} / {sub_value_text}",
+                )
+            )
 
         LOGGER.info("주소 목록 파싱 완료: %d개", len(addresses))
         return addresses
 
+    def _snapshot_list(
+        self, css_selector: str, container_css: Optional[str] = None, input_element=None
+    ) -> dict:
+        """
+        목적: 목록을 다시 그리게 하기 전에 현재 목록 상태를 저장 (_wait_for_list_refresh용)
+
+        Args:
+            css_selector: 목록 항목의 CSS 선택자
+            container_css: 목록 컨테이너의 CSS 선택자 (표시 여부 확인용, 없으면 None)
+            input_element: 목록을 띄우는 입력 필드 (입력값 비교용, 없으면 None)
+
+        Returns:
+            {"first": 첫 항목 또는 None, "count": 개수, "text": 항목 텍스트,
+             "visible": 컨테이너 표시 여부, "input_value": 입력값 또는 None, ...}
+        """
+        return self.driver.execute_script(
+            _LIST_STATE_JS, css_selector, None, container_css, input_element
+        )
+
+    def _wait_for_list_refresh(
+        self,
+        css_selector: str,
+        previous: dict,
+        timeout: float,
+        container_css: Optional[str] = None,
+        input_element=None,
+    ) -> int:
+        """
+        목적: 이전 목록이 새 목록으로 바뀌고, 새 목록이 안정될 때까지 대기
+        고정 sleep 대신 사용 (DOM이 준비되면 바로 진행)
+
+        개수만 보면 이전 검색의 목록도 "안정된 목록"이라 바로 통과하므로,
+        아래 중 하나가 확인된 뒤부터 안정 여부를 본다 (= 목록이 새로 그려짐).
+        - 이전 첫 항목이 DOM에서 빠짐(stale) 또는 목록 내용이 바뀜
+        - 입력값이 이전과 다르고, 컨테이너가 보이며 항목이 있음 (진행 중인 ajax가 없을 때)
+        - 입력값이 이전과 같고(같은 검색어 재검색) 목록도 같음: 같은 목록이 곧 새 결과
+
+        완료 조건 (개수/내용/표시 여부가 연속 두 번 같을 때):
+        - 새 목록: 항목이 있으면 완료
+        - 빈 목록: 컨테이너가 숨겨졌고 진행 중인 ajax가 없을 때만 결과 없음으로 완료
+          (검색 요청이 끝나기 전 잠깐 빈 목록을 결과 없음으로 보지 않도록).
+          container_css가 없거나 jQuery가 없어 완료를 알 수 없으면 빈 목록은 timeout까지 기다림
+
+        Args:
+            css_selector: 목록 항목의 CSS 선택자
+            previous: _snapshot_list로 저장한 이전 목록 상태
+            timeout: 최대 대기 시간 (초)
+            container_css: 목록 컨테이너의 CSS 선택자 (_snapshot_list와 같은 값)
+            input_element: 목록을 띄우는 입력 필드 (_snapshot_list와 같은 값)
+
+        Returns:
+            새 목록의 항목 개수 (결과 없음이면 0)
+
+        Raises:
+            TimeoutException: timeout 안에 목록이 바뀌지 않았거나 안정되지 않았을 때
+        """
+        previous_first = previous["first"]
+        previous_text = previous["text"]
+        previous_input = previous.get("input_value")
+        # 이전 목록이 비어 있었으면 stale 여부를 볼 대상이 없음
+        refreshed = [previous_first is None]
+        last_state = [None]
+
+        def list_is_ready(driver):
+            # 갱신이 확인된 뒤에는 이전 항목/입력 필드를 넘기지 않음 (stale 오판 방지)
+            probe = None if refreshed[0] else previous_first
+            probe_input = None if refreshed[0] else input_element
+            try:
+                state = driver.execute_script(
+                    _LIST_STATE_JS, css_selector, probe, container_css, probe_input
+                )
+            except StaleElementReferenceException:
+                # 이전 첫 항목이 DOM에서 사라짐 = 목록을 다시 그림
+                refreshed[0] = True
+                return False
+
+            if not refreshed[0]:
+                same_list = state["prev_attached"] and state["text"] == previous_text
+                shown = state["count"] and state["visible"]
+                if input_element is not None and shown:
+                    # 검색어가 바뀐 뒤 목록이 보이거나(요청 진행 중이면 아직 이전 목록일 수 있음),
+                    # 같은 검색어라 같은 목록이 보임
+                    input_changed = (
+                        state["input_value"] != previous_input
+                        and state["ajax_idle"] is not False
+                    )
+                    refreshed[0] = input_changed or same_list
+                elif not same_list:
+                    refreshed[0] = True
+                if not refreshed[0]:
+                    # 아직 이전 목록 그대로
+                    return False
+
+            current = (state["count"], state["text"], state["visible"])
+            if current != last_state[0]:
+                last_state[0] = current
+                return False
+
+            if state["count"]:
+                return state
+
+            # 빈 목록: 컨테이너가 숨겨졌고 검색 요청이 끝났을 때만 결과 없음으로 확정
+            if container_css and not state["visible"] and state["ajax_idle"]:
+                return state
+            return False
+
+        wait = WebDriverWait(self.driver, timeout, poll_frequency=self.LIST_POLL_SECONDS)
+        return wait.until(list_is_ready)["count"]
+
     def _handle_back_buttons(self) -> None:
         """
         목적: 뒤로가기 버튼 순차 확인 및 처리
@@ -198,9 +519,9 @@ class SeleniumCrawler:
 
         # 1. foot_back_btn 확인 (상세 페이지 뒤로가기)
         try:
-            short_wait = WebDriverWait(self.driver, 0.3)
+            short_wait = self._back_button_wait
             foot_back_btn = short_wait.until(
-                EC.element_to_be_clickable((By.ID, "foot_back_btn"))
+                EC.element_to_be_clickable(FOOT_BACK_BUTTON_LOCATOR)
             )
             self.driver.execute_script("arguments[0].click();", foot_back_btn)
             back_clicked = True
@@ -211,11 +532,9 @@ class SeleniumCrawler:
         # 2. 일반 뒤로가기 버튼 확인
         if not back_clicked:
             try:
-                short_wait = WebDriverWait(self.driver, 0.3)
+                short_wait = self._back_button_wait
                 back_image = short_wait.until(
-                    EC.element_to_be_clickable(
-                        (By.XPATH, "//img[contains(@src, 'back')]")
-                    )
+                    EC.element_to_be_clickable(BACK_IMAGE_LOCATOR)
                 )
                 self.driver.execute_script("arguments[0].click();", back_image)
                 LOGGER.info("일반 뒤로가기 버튼 클릭 완료")
@@ -237,16 +556,12 @@ class SeleniumCrawler:
             raise RuntimeError("크롤러가 초기화되지 않았습니다.")
 
         # 현재 페이지의 자동완성 항목들을 다시 가져옴
-        wait = WebDriverWait(self.driver, 4)
+        wait = self._search_wait
         suggestions_container = wait.until(
-            EC.presence_of_element_located(
-                (By.CLASS_NAME, "ds-autocomplete-suggestions")
-            )
+            EC.presence_of_element_located(SUGGESTIONS_CONTAINER_LOCATOR)
         )
 
-        suggestion_elements = suggestions_container.find_elements(
-            By.CLASS_NAME, "autocomplete-suggestion"
-        )
+        suggestion_elements = suggestions_container.find_elements(*SUGGESTION_ITEM_LOCATOR)
 
         if index < 0 or index >= len(suggestion_elements):
             raise ValueError(f"잘못된 주소 인덱스: {index}")
@@ -269,109 +584,76 @@ class SeleniumCrawler:
         if not self.driver:
             raise RuntimeError("크롤러가 초기화되지 않았습니다.")
 
-        # 건물 탭 클릭 (재시도 로직 포함)
-        for attempt in range(2):
-            try:
-                LOGGER.info("건물 탭 클릭 시도 중... (시도 %d)", attempt + 1)
-                wait = WebDriverWait(self.driver, 5)
-                building_tab = wait.until(
-                    EC.element_to_be_clickable((By.ID, "dp_navi_4"))
-                )
-                self.driver.execute_script("arguments[0].click();", building_tab)
-                LOGGER.info("건물 탭 클릭 성공")
-                break
-            except TimeoutException:
-                LOGGER.warning("건물 탭 요소를 찾을 수 없음 (시도 %d)", attempt + 1)
-                if attempt == 0:
-                    time.sleep(1)  # 재시도 전 대기
-                else:
-                    raise RuntimeError("건물 탭 클릭 최종 실패")
-            except Exception as exc:
-                LOGGER.warning("건물 탭 클릭 실패 (시도 %d): %s", attempt + 1, exc)
-                if attempt == 0:
-                    time.sleep(1)
-                else:
-                    raise RuntimeError(f"건물 탭 클릭 최종 실패: {exc}")
+        # 이전 건물 목록 (새 목록으로 바뀌었는지 판단용)
+        previous_buildings = self._snapshot_list(BUILDING_ITEMS_CSS)
+
+        # 건물 탭 클릭
+        # WebDriverWait가 내부에서 계속 재확인하므로 따로 재시도 루프를 두지 않음
+        try:
+            LOGGER.info("건물 탭 클릭 시도 중...")
+            wait = WebDriverWait(self.driver, 6)
+            building_tab = wait.until(EC.element_to_be_clickable(BUILDING_TAB_LOCATOR))
+            self.driver.execute_script("arguments[0].click();", building_tab)
+            LOGGER.info("건물 탭 클릭 성공")
+        except TimeoutException:
+            LOGGER.warning("건물 탭 요소를 찾을 수 없음")
+            raise RuntimeError("건물 탭 클릭 최종 실패")
+        except Exception as exc:
+            LOGGER.warning("건물 탭 클릭 실패: %s", exc)
+            raise RuntimeError(f"건물 탭 클릭 최종 실패: {exc}")
 
         # 건물 목록 요소 대기
         wait = WebDriverWait(self.driver, 2)
-        wait.until(EC.presence_of_element_located((By.CLASS_NAME, "ddiv-build-content")))
-        time.sleep(0.5)
+        wait.until(EC.presence_of_element_located(BUILDING_ITEM_LOCATOR))
+        try:
+            self._wait_for_list_refresh(BUILDING_ITEMS_CSS, previous_buildings, 2)
+        except TimeoutException:
+            LOGGER.warning("건물 목록이 갱신/안정되지 않음 (현재 목록으로 진행)")
 
-        # 건물 요소들 가져오기
-        building_elements = self.driver.find_elements(By.CLASS_NAME, "ddiv-build-content")
+        # 건물 요소들의 텍스트를 JavaScript 한 번으로 가져오기
+        # 이유: 건물마다 find_element/execute_script를 부르면 건물 수 x 3번 왕복이 생김
+        # top/bottom이 없는 건물은 null로 돌려받아 건너뜀 (인덱스는 DOM 순서 그대로 유지)
+        # 건물 요소 자체도 같이 받아 select_building에서 다시 찾지 않도록 보관
+        building_data = self.driver.execute_script(_BUILDINGS_JS) or []
+        self._building_elements = [data["element"] for data in building_data]
 
-        if not building_elements:
+        if not building_data:
             LOGGER.warning("건물 목록이 없음")
             return []
 
         # Building 엔티티 생성 (지역 변수)
         buildings = []
+        # 건물별 로그는 상세 로그 켰을 때만 (건물 수만큼 LogRecord 생성 방지)
+        log_each = is_verbose_logging()
 
-        for idx, element in enumerate(building_elements):
-            try:
-                top_elem = element.find_element(By.CLASS_NAME, "ddiv-build-content-top")
-                bottom_elem = element.find_element(
-                    By.CLASS_NAME, "ddiv-build-content-bottom"
-                )
+        for idx, data in enumerate(building_data):
+            if data["top"] is None or data["bottom"] is None:
+                LOGGER.warning("건물 요소 파싱 실패 (인덱스: %d)", idx)
+                continue
 
-                # JavaScript로 텍스트 가져오기
-                top_text = self.driver.execute_script(
-                    "return arguments[0].textContent || arguments[0].innerText || '';",
-                    top_elem,
-                ).strip()
-
-                bottom_text = self.driver.execute_script(
-                    "return arguments[0].textContent || arguments[0].innerText || '';",
-                    bottom_elem,
-                ).strip()
-
-                # 비어있으면 일반 .text 시도
-                if not top_text:
-                    top_text = top_elem.text.strip()
-                if not bottom_text:
-                    bottom_text = bottom_elem.text.strip()
-
-                # 타이틀 요소 가져오기 (선택적)
-                title_text = ""
-                try:
-                    title_elem = element.find_element(
-                        By.CLASS_NAME, "ddiv-build-content-title"
-                    )
-                    title_text = self.driver.execute_script(
-                        "return arguments[0].textContent || arguments[0].innerText || '';",
-                        title_elem,
-                    ).strip()
-                    if not title_text:
-                        title_text = title_elem.text.strip()
-                except NoSuchElementException:
-                    pass
-
-                # 표시 형식 결정
-                if title_text:
-                    display_text = f"{top_text}({bottom_text}) [{title_text}]"
-                else:
-                    display_text = f"{top_text}({bottom_text})"
-
-                # 건물 정보 저장
-                buildings.append(
-                    Building(
-                        index=idx,
-                        top=top_text,
-                        bottom=bottom_text,
-                        title=title_text,
-                        display=display_text,
-                    )
-                )
+            top_text = data["top"]
+            bottom_text = data["bottom"]
+            title_text = data["title"]
 
-                LOGGER.info("건물 파싱 #%d: %s", idx, display_text)
+            # 표시 형식 결정
+            if title_text:
+                display_text = f"{top_text}({bottom_text}) [{title_text}]"
+            else:
+                display_text = f"{top_text}({bottom_text})"
+
+            # 건물 정보 저장
+            buildings.append(
+                Building(
+                    index=idx,
+                    top=top_text,
+                    bottom=bottom_text,
+                    title=title_text,
+                    display=display_text,
+                )
+            )
 
-            except NoSuchElementException:
-                LOGGER.warning("건물 요소 파싱 실패 (인덱스: %d)", idx)
-                continue
-            except Exception as exc:
-                LOGGER.warning("건물 정보 추출 실패 (인덱스: %d): %s", idx, exc)
-                continue
+            if log_each:
+                LOGGER.debug("건물 파싱 #%d: %s", idx, display_text)
 
         LOGGER.info("건물 목록 파싱 완료: 총 %d개", len(buildings))
         return buildings
@@ -391,21 +673,30 @@ class SeleniumCrawler:
         if not self.driver:
             raise RuntimeError("크롤러가 초기화되지 않았습니다.")
 
-        # 현재 페이지의 건물 요소들 다시 가져오기
-        building_elements = self.driver.find_elements(By.CLASS_NAME, "ddiv-build-content")
+        # get_buildings에서 보관한 건물 요소 사용 (없으면 현재 페이지에서 가져오기)
+        building_elements = self._building_elements or self.driver.find_elements(
+            *BUILDING_ITEM_LOCATOR
+        )
 
         if index < 0 or index >= len(building_elements):
             raise ValueError(f"잘못된 건물 인덱스: {index}")
 
         # 선택된 건물 클릭
-        target_element = building_elements[index]
-        self.driver.execute_script("arguments[0].click();", target_element)
+        try:
+            self.driver.execute_script("arguments[0].click();", building_elements[index])
+        except StaleElementReferenceException:
+            # 목록이 다시 그려졌으면 그때만 다시 가져오기
+            LOGGER.info("보관한 건물 요소가 만료됨, 건물 목록 다시 조회")
+            building_elements = self.driver.find_elements(*BUILDING_ITEM_LOCATOR)
+            if index >= len(building_elements):
+                raise ValueError(f"잘못된 건물 인덱스: {index}")
+            self.driver.execute_script("arguments[0].click();", building_elements[index])
         LOGGER.info("건물 선택 완료 (인덱스: %d)", index)
 
         # 상세 페이지 전환 대기 (동적 대기)
-        wait = WebDriverWait(self.driver, 5)
+        wait = WebDriverWait(self.driver, 5, poll_frequency=self.DETAIL_POLL_SECONDS)
         wait.until(
-            EC.presence_of_element_located((By.CLASS_NAME, "mfs-agent-main-tab-div"))
+            EC.presence_of_element_located(DETAIL_TAB_LOCATOR)
         )
         LOGGER.info("상세 페이지 로딩 완료")
 
@@ -427,77 +718,63 @@ class SeleniumCrawler:
 
         # 동적 대기: 크롤링 대상 요소가 로드될 때까지 대기 (최대 5초)
         # 이유: select_building에서 이미 대기했지만, 직접 호출 시에도 안전하게 처리
-        wait = WebDriverWait(self.driver, 5)
+        wait = WebDriverWait(self.driver, 5, poll_frequency=self.DETAIL_POLL_SECONDS)
         wait.until(
-            EC.presence_of_element_located((By.CLASS_NAME, "mfs-agent-main-tab-div"))
+            EC.presence_of_element_located(DETAIL_TAB_LOCATOR)
         )
 
         # JavaScript로 크롤링
-        script = """
-            return Array.from(document.querySelectorAll('.mfs-agent-main-tab-div'))
-                .map(div => {
-                    const titleElem = div.querySelector('.ifs-tab-txt');
-
-                    // 오른쪽 div 찾기 - 방법1: rfc-dusk 클래스
-                    let rightDiv = div.querySelector('.ifs-tab-txt.rfc-dusk');
-
-                    // 방법2: rfc-dusk가 없으면 두 번째 ifs-tab-txt 요소
-                    if (!rightDiv) {
-                        const allTabTxts = div.querySelectorAll('.ifs-tab-txt');
-                        if (allTabTxts.length >= 2) {
-                            rightDiv = allTabTxts[1];
-                        }
-                    }
-
-                    let content = '';
-
-                    if (rightDiv) {
-                        const contentElem = rightDiv.querySelector('span[id]') ||
-                                           rightDiv.querySelector('span');
-
-                        if (contentElem && contentElem.textContent.trim()) {
-                            content = contentElem.textContent.trim();
-                        } else {
-                            content = '값 없음';
-                        }
-                    } else {
-                        content = '값 없음';
-                    }
-
-                    return {
-                        title: titleElem ? titleElem.textContent.trim() : '',
-                        content: content
-                    };
-                })
-                .filter(item => item.title);
-        """
-
-        crawled_data = self.driver.execute_script(script)
+        crawled_data = self.driver.execute_script(_CRAWL_JS)
 
         # CrawlItem 엔티티 생성
         items = [
-            CrawlItem(title=item["title"], content=item["content"]) for item in crawled_data
+            CrawlItem(title=title, content=content) for title, content in crawled_data
         ]
 
-        # 크롤링 결과 로깅
+        # 크롤링 결과 로깅 (항목별 내용은 상세 로그 켰을 때만)
         LOGGER.info("크롤링 완료: %d개 항목", len(items))
-        for item in items:
-            LOGGER.info("  - %s: %s", item.title, item.content)
-            # 값이 없는 경우 경고
-            if item.content == "값 없음":
-                LOGGER.warning("    ⚠️ '%s' 항목: 값을 찾을 수 없음", item.title)
+        if is_verbose_logging():
+            for item in items:
+                LOGGER.debug("  - %s: %s", item.title, item.content)
+
+        # 값이 없는 항목은 경고 한 줄로 모아서 남김
+        missing_titles = [item.title for item in items if item.content == "값 없음"]
+        if missing_titles:
+            LOGGER.warning("⚠️ 값을 찾을 수 없는 항목: %s", ", ".join(missing_titles))
 
         return items
 
     def close(self) -> None:
         """
         목적: 드라이버 종료 및 리소스 정리
+        드라이버를 띄우는 중(잠금을 다른 스레드가 가짐)이면 기다리지 않고 돌아간다.
+        띄우던 스레드가 Chrome이 뜬 직후 종료 표시를 보고 직접 정리한다.
         """
-        if self.driver:
-            try:
-                self.driver.quit()
-                LOGGER.info("드라이버 종료 완료")
-            except Exception as exc:
-                LOGGER.warning("드라이버 종료 중 예외: %s", exc)
-            finally:
-                self.driver = None
\ No newline at end of file
+        self._closed.set()
+
+        if not self._driver_lock.acquire(blocking=False):
+            LOGGER.info("드라이버를 띄우는 중이라 띄운 스레드에서 종료")
+            return
+
+        try:
+            self._quit_driver()
+        finally:
+            self._driver_lock.release()
+
+    def _quit_driver(self) -> None:
+        """
+        목적: 드라이버 quit 및 관련 상태 초기화 (호출자가 _driver_lock을 가진 상태)
+        """
+        if not self.driver:
+            return
+
+        try:
+            self.driver.quit()
+            LOGGER.info("드라이버 종료 완료")
+        except Exception as exc:
+            LOGGER.warning("드라이버 종료 중 예외: %s", exc)
+        finally:
+            self.driver = None
+            self._building_elements = []
+            self._search_wait = None
+            self._back_button_wait = None
\ No newline at end of file
@@ -3,9 +3,12 @@
 JSON 파일로 설정을 관리한다.
 """
 
+import hashlib
 import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from src.features.site_crawler.infra.json_file_io import dumps_json, loads_json, write_atomic
 
 
 class SettingsRepository:
@@ -20,6 +23,15 @@ class SettingsRepository:
         """
         self.settings_path = self._get_settings_path()
 
+        # 마지막으로 읽거나 쓴 파일 내용의 SHA-256 (변경 없는 저장 스킵용)
+        self._last_saved_digest: Optional[bytes] = None
+        # 그 내용을 읽거나 쓴 직후의 (st_mtime_ns, st_size): 외부에서 파일이 바뀌었는지 판별
+        self._last_saved_key: Optional[tuple] = None
+
+        # 파싱 결과 캐시: (st_mtime_ns, st_size)가 같으면 파일을 다시 읽지 않음
+        self._cache_key: Optional[tuple] = None
+        self._cache_data: Dict[str, Any] = {}
+
     def _get_settings_path(self) -> Path:
         """
         목적: 설정 파일 경로 반환
@@ -32,6 +44,19 @@ class SettingsRepository:
         settings_dir.mkdir(parents=True, exist_ok=True)
         return settings_dir / "settings.json"
 
+    def _stat_key(self) -> Optional[tuple]:
+        """
+        목적: 파일의 (st_mtime_ns, st_size) 반환
+
+        Returns:
+            변경 판별용 키 (파일이 없으면 None)
+        """
+        try:
+            stat = self.settings_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def load(self) -> Dict[str, Any]:
         """
         목적: 설정 로드
@@ -44,8 +69,18 @@ class SettingsRepository:
             return default_settings
 
         try:
-            with open(self.settings_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            stat = self.settings_path.stat()
+            key = (stat.st_mtime_ns, stat.st_size)
+
+            if key != self._cache_key:
+                raw = self.settings_path.read_bytes()
+                self._cache_data = loads_json(raw)
+                self._last_saved_digest = hashlib.sha256(raw).digest()
+                self._last_saved_key = key
+                self._cache_key = key
+
+            # 호출자가 수정해도 캐시가 오염되지 않도록 복사본 반환
+            return dict(self._cache_data)
         except (json.JSONDecodeError, IOError) as exc:
             # 파일이 손상되었거나 읽을 수 없는 경우 기본값 반환
             print(f"설정 파일 로드 실패: {exc}")
@@ -53,10 +88,19 @@ class SettingsRepository:
 
     def save(self, settings: Dict[str, Any]) -> None:
         """
-        목적: 설정 저장
+        목적: 설정 저장 (마지막으로 읽거나 쓴 내용과 같으면 쓰기 생략)
 
         Args:
             settings: 저장할 설정 딕셔너리
         """
-        with open(self.settings_path, "w", encoding="utf-8") as f:
-            json.dump(settings, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+        data = dumps_json(settings)
+        digest = hashlib.sha256(data).digest()
+
+        # 마지막 상태와 내용이 같고 그 뒤 디스크의 파일도 그대로면 쓰기 생략
+        if digest == self._last_saved_digest and self._stat_key() == self._last_saved_key:
+            return
+
+        write_atomic(self.settings_path, data)
+        self._last_saved_digest = digest
+        self._last_saved_key = self._stat_key()
+        self._cache_key = None
\ No newline at end of file
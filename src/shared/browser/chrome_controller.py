@@ -38,7 +38,9 @@ class ChromeController:
 
     DEFAULT_DEBUGGER_ADDRESS = "127.0.0.1:2578"
     DEFAULT_DEBUGGER_PORT = 2578
-    STARTUP_WAIT_SECONDS = 3
+    STARTUP_WAIT_SECONDS = 10  # 크롬 실행 후 디버깅 포트가 열리기를 기다리는 최대 시간
+    STARTUP_POLL_SECONDS = 0.05
+    PORT_CHECK_TIMEOUT_SECONDS = 0.1  # 로컬 포트는 열려 있으면 바로 응답함
     DEFAULT_START_URL = "https://www.jejuall.com/"
 
     def __init__(self, debugger_address: str = None, start_url: str = None):
@@ -50,9 +52,20 @@ class ChromeController:
             start_url: 크롬 실행 시 열 URL (기본: jejuall.com)
         """
         self._address = debugger_address or self.DEFAULT_DEBUGGER_ADDRESS
+        # 포트 체크 때마다 split하지 않도록 한 번만 분리
+        host, port = self._address.rsplit(":", 1)
+        self._host = host
+        self._port = int(port)
         self._start_url = start_url or self.DEFAULT_START_URL
         self._driver = None
         self._main_handle = None
+
+        # 연결 시 한 번 계산해 두는 메이저 버전 (빈 문자열이면 알 수 없음)
+        self._browser_major = ""
+        self._driver_major = ""
+        # 버전 로깅은 첫 연결 때 한 번만
+        self._versions_logged = False
+
         self._launch_or_connect()
 
     def _get_profile_dir(self) -> Path:
@@ -99,15 +112,24 @@ class ChromeController:
         logger.info("크롬 실행 시도: %s", chrome_path)
         logger.info("디버깅 포트: %s", self.DEFAULT_DEBUGGER_PORT)
 
+        # 크롬은 앱과 별개로 계속 떠 있어야 하므로 핸들/콘솔을 물려주지 않고 분리 실행
+        creationflags = 0
+        if os.name == "nt":
+            creationflags = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+
         try:
-            subprocess.Popen([
-                chrome_path,
-                f"--remote-debugging-port={self.DEFAULT_DEBUGGER_PORT}",
-                f"--user-data-dir={profile_dir}",
-                self._start_url,
-            ])
-            logger.info("크롬 실행 완료, %s초 대기", self.STARTUP_WAIT_SECONDS)
-            time.sleep(self.STARTUP_WAIT_SECONDS)
+            subprocess.Popen(
+                [
+                    chrome_path,
+                    f"--remote-debugging-port={self.DEFAULT_DEBUGGER_PORT}",
+                    f"--user-data-dir={profile_dir}",
+                    self._start_url,
+                ],
+                close_fds=True,
+                creationflags=creationflags,
+            )
+            logger.info("크롬 실행 완료, 디버깅 포트 대기 (최대 %s초)", self.STARTUP_WAIT_SECONDS)
+            self._wait_for_port()
         except FileNotFoundError:
             logger.error("크롬 실행 파일을 찾을 수 없음: %s", chrome_path)
             raise RuntimeError(
@@ -139,18 +161,29 @@ class ChromeController:
 
         logger.info("크롬 연결 성공")
 
+    def _wait_for_port(self) -> None:
+        """
+        디버깅 포트가 열릴 때까지 대기 (고정 sleep 대신)
+
+        STARTUP_WAIT_SECONDS 안에 안 열리면 그냥 반환하고,
+        이어지는 연결 시도에서 실패 처리된다.
+        """
+        deadline = time.monotonic() + self.STARTUP_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            if self._is_port_open():
+                return
+            time.sleep(self.STARTUP_POLL_SECONDS)
+        logger.warning("디버깅 포트가 %s초 안에 열리지 않음", self.STARTUP_WAIT_SECONDS)
+
     def _is_port_open(self) -> bool:
-        """포트 열려있는지 빠르게 체크 (1초 타임아웃)"""
-        host, port = self._address.split(":")
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1.0)
+        """포트 열려있는지 빠르게 체크 (0.1초 타임아웃)"""
         try:
-            sock.connect((host, int(port)))
-            return True
-        except (socket.timeout, ConnectionRefusedError, OSError):
+            with socket.create_connection(
+                (self._host, self._port), timeout=self.PORT_CHECK_TIMEOUT_SECONDS
+            ):
+                return True
+        except OSError:
             return False
-        finally:
-            sock.close()
 
     def _try_connect(self) -> bool:
         """
@@ -166,9 +199,17 @@ class ChromeController:
 
         options = webdriver.ChromeOptions()
         options.add_experimental_option("debuggerAddress", self._address)
+        # 로그를 읽지 않으므로 chromedriver가 브라우저/성능 로그를 쌓아 두지 않도록 끔
+        options.set_capability(
+            "goog:loggingPrefs",
+            {"browser": "OFF", "driver": "OFF", "performance": "OFF"},
+        )
 
         try:
             self._driver = webdriver.Chrome(options=options)
+
+            # 암묵적 대기는 모든 find_element에 붙으므로 끄고 명시적 대기만 사용
+            self._driver.implicitly_wait(0)
             self._log_versions()
 
             try:
@@ -184,27 +225,47 @@ class ChromeController:
             return False
 
     def _log_versions(self) -> None:
-        """브라우저와 ChromeDriver 버전 로깅"""
+        """브라우저와 ChromeDriver 버전 로깅 (첫 연결 때 한 번만)"""
+        if self._versions_logged:
+            return
+
         caps = getattr(self._driver, "capabilities", {}) or {}
         browser_version = caps.get("browserVersion") or caps.get("version") or "unknown"
         chrome_info = caps.get("chrome") or {}
         chromedriver_version_raw = chrome_info.get("chromedriverVersion") or "unknown"
-        chromedriver_version = chromedriver_version_raw.split(" ")[0]
+        chromedriver_version = chromedriver_version_raw.split(" ", 1)[0]
 
         logger.info("브라우저 버전: %s", browser_version)
         logger.info("ChromeDriver 버전: %s", chromedriver_version)
 
         def _major(ver: str) -> str:
-            return ver.split(".")[0] if ver and ver != "unknown" else ""
+            return ver.split(".", 1)[0] if ver and ver != "unknown" else ""
+
+        self._browser_major = _major(browser_version)
+        self._driver_major = _major(chromedriver_version)
 
-        if _major(browser_version) and _major(chromedriver_version):
-            if _major(browser_version) != _major(chromedriver_version):
+        if self._browser_major and self._driver_major:
+            if self.version_mismatch:
                 logger.warning(
                     "브라우저와 ChromeDriver 메이저 버전이 다름! 문제가 생길 수 있어."
                 )
             else:
                 logger.info("브라우저와 ChromeDriver 버전 호환 확인됨")
 
+        self._versions_logged = True
+
+    @property
+    def version_mismatch(self) -> bool:
+        """
+        브라우저와 ChromeDriver 메이저 버전이 다른지 여부
+
+        연결 시 계산해 둔 값을 쓰므로 capabilities를 다시 읽지 않음.
+        버전을 알 수 없으면 False.
+        """
+        if not self._browser_major or not self._driver_major:
+            return False
+        return self._browser_major != self._driver_major
+
     def get_driver(self) -> webdriver.Chrome:
         """
         WebDriver 인스턴스 반환
@@ -219,7 +280,16 @@ class ChromeController:
         메인 탭으로 포커스 전환
 
         devtools:// 탭이 아닌 실제 웹 페이지 탭으로 전환
+        이미 메인 탭에 있으면 현재 핸들 조회 한 번으로 끝냄 (탭 목록 조회 생략)
         """
+        if self._main_handle:
+            try:
+                if self._driver.current_window_handle == self._main_handle:
+                    return
+            except WebDriverException:
+                # 현재 탭이 닫혔을 수 있음: 아래에서 탭 목록으로 다시 확인
+                pass
+
         try:
             handles = self._driver.window_handles
         except WebDriverException:
@@ -243,6 +313,71 @@ class ChromeController:
             return
 
         # 메인 핸들이 없으면 devtools가 아닌 첫 번째 탭 찾기
+        fallback = self._find_page_tab(handles, current)
+
+        # 찾은 탭으로 전환
+        if fallback:
+            self._main_handle = fallback
+            if current != fallback:
+                logger.info("탭 전환: %s -> %s (대체)", current, fallback)
+                try:
+                    self._driver.switch_to.window(fallback)
+                except WebDriverException:
+                    logger.warning("대체 핸들 전환 실패")
+
+    def _find_page_tab(self, handles: list[str], current: str) -> str | None:
+        """
+        devtools:// 가 아닌 웹 페이지 탭 핸들 찾기
+
+        CDP Target.getTargets 한 번으로 모든 탭 URL을 받아서 고른다.
+        (크롬 드라이버의 윈도우 핸들 == CDP targetId)
+        CDP 호출이 안 되거나 CDP 타겟과 맞는 핸들이 하나도 없으면
+        탭을 하나씩 전환해 보는 방식으로 폴백.
+
+        Args:
+            handles: 현재 윈도우 핸들 목록
+            current: 현재 핸들
+
+        Returns:
+            str | None: 찾은 핸들 (없으면 None)
+        """
+        try:
+            targets = self._driver.execute_cdp_cmd("Target.getTargets", {})["targetInfos"]
+        except (WebDriverException, KeyError):
+            logger.warning("CDP 탭 목록 조회 실패, 탭 전환 방식으로 검사")
+            return self._probe_page_tab(handles, current)
+
+        url_by_handle = {
+            t["targetId"]: t.get("url", "") for t in targets if t.get("type") == "page"
+        }
+
+        # 현재 탭이 아닌 탭을 먼저 보고, 없으면 현재 탭도 후보로
+        candidates = [h for h in handles if h != current] + [current]
+        matched = False
+        for handle in candidates:
+            url = url_by_handle.get(handle)
+            if url is None:
+                continue
+            matched = True
+            logger.info("탭 검사: %s -> %s", handle, url)
+            if not url.startswith("devtools://"):
+                return handle
+
+        # 핸들과 targetId가 하나도 안 맞으면 (드라이버가 다른 형식의 핸들을 쓰는 경우)
+        # CDP 결과로는 판단할 수 없으므로 탭 전환 방식으로 검사
+        if not matched:
+            logger.warning("CDP 타겟과 일치하는 핸들 없음, 탭 전환 방식으로 검사")
+            return self._probe_page_tab(handles, current)
+
+        return None
+
+    def _probe_page_tab(self, handles: list[str], current: str) -> str | None:
+        """
+        탭을 하나씩 전환하며 devtools가 아닌 탭 찾기 (CDP 실패 시 폴백)
+
+        Returns:
+            str | None: 찾은 핸들 (없으면 None)
+        """
         fallback = None
         for handle in handles:
             if handle == current:
@@ -264,12 +399,4 @@ class ChromeController:
         except WebDriverException:
             logger.warning("원래 탭으로 복귀 실패")
 
-        # 찾은 탭으로 전환
-        if fallback:
-            self._main_handle = fallback
-            if current != fallback:
-                logger.info("탭 전환: %s -> %s (대체)", current, fallback)
-                try:
-                    self._driver.switch_to.window(fallback)
-                except WebDriverException:
-                    logger.warning("대체 핸들 전환 실패")
+        return fallback
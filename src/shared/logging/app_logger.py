@@ -20,9 +20,20 @@
 - UI 콘솔 로그와는 별개로 파일에만 기록됨
 - 실행마다 새 로그 파일 생성 (app_YYYY-MM-DD_HH-MM-SS.log)
 - 최대 5개 파일 유지, 초과 시 가장 오래된 파일 자동 삭제
+- 로그 파일은 첫 기록 때 생성됨 (import만 하고 기록하지 않으면 파일 없음)
+- 파일 쓰기는 백그라운드 스레드(QueueListener)에서 처리됨 (호출 스레드는 큐에 넣고 바로 반환)
+- 로거 레벨은 항상 DEBUG라 isEnabledFor(DEBUG)로는 상세 로그를 끌 수 없음.
+  드라이버 왕복이나 항목별 로그처럼 비싼 진단 로그는 is_verbose_logging()으로 감쌀 것
+  (환경변수 RHELPER_VERBOSE_LOG=1일 때만 켜짐, 기본 꺼짐)
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -33,6 +44,19 @@ LOGS_DIR = Path(__file__).parent / "logs"
 # 로테이션 설정: 최대 유지할 로그 파일 개수
 MAX_LOG_FILES = 5
 
+# 상세 진단 로그 스위치 (환경변수, 기본 꺼짐)
+# 예: set RHELPER_VERBOSE_LOG=1
+VERBOSE_LOG_ENV = "RHELPER_VERBOSE_LOG"
+_VERBOSE_LOGGING = os.environ.get(VERBOSE_LOG_ENV, "").strip() not in ("", "0")
+
+# 묶어서 쓰기 설정: 버퍼 크기(레코드 수)와 주기적 flush 간격(초)
+# ERROR 이상은 버퍼와 관계없이 바로 기록됨
+LOG_BUFFER_CAPACITY = 256
+LOG_FLUSH_INTERVAL_SECONDS = 1.0
+
+# 설정이 끝난 로거 (두 번째 호출부터는 getLogger의 전역 락 없이 바로 반환)
+_configured_logger: logging.Logger | None = None
+
 # 로그 포맷: CLAUDE.md 19번 규칙 준수
 LOG_FORMAT = "%(asctime)s %(levelname)s [%(pathname)s:%(lineno)d %(funcName)s] %(message)s"
 
@@ -44,20 +68,147 @@ def _cleanup_old_logs() -> None:
     동작:
     - logs 폴더 내 app_*.log 파일을 수정 시간 기준 정렬
     - MAX_LOG_FILES개 초과 시 오래된 파일부터 삭제
+
+    os.scandir를 쓰는 이유: 목록을 한 번에 읽고, 파일 개수가 한도 이하면
+    stat 없이 바로 끝낸다 (glob + 파일마다 stat 방지).
     """
-    if not LOGS_DIR.exists():
+    try:
+        with os.scandir(LOGS_DIR) as it:
+            entries = [
+                entry for entry in it
+                if entry.name.startswith("app_") and entry.name.endswith(".log")
+            ]
+    except FileNotFoundError:
         return
 
-    # app_*.log 패턴의 파일만 수집
-    log_files = sorted(
-        LOGS_DIR.glob("app_*.log"),
-        key=lambda f: f.stat().st_mtime,
-        reverse=True,  # 최신 파일이 앞에 오도록
-    )
+    if len(entries) <= MAX_LOG_FILES:
+        return
+
+    # 최신 파일이 앞에 오도록 정렬
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
 
     # MAX_LOG_FILES개 초과 시 오래된 파일 삭제
-    for old_file in log_files[MAX_LOG_FILES:]:
-        old_file.unlink()
+    for old_entry in entries[MAX_LOG_FILES:]:
+        try:
+            os.unlink(old_entry.path)
+        except OSError:
+            # 다른 프로세스가 쓰는 중이면 (Windows) 다음 실행 때 다시 시도
+            continue
+
+
+class _CleanupOnFirstRecord(logging.Filter):
+    """
+    첫 로그 기록 직전에 오래된 로그를 한 번만 정리하고 스스로 빠지는 필터
+
+    FileHandler(delay=True)와 같이 써서, 기록하지 않는 실행에서는
+    로그 폴더를 건드리지 않는다. 새 로그 파일은 이 필터가 끝난 뒤에 열리므로
+    정리 대상 개수는 예전(시작 시 정리)과 같다.
+    """
+
+    def __init__(self, handler: logging.Handler):
+        super().__init__()
+        self._handler = handler
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        self._handler.removeFilter(self)
+        try:
+            _cleanup_old_logs()
+        except OSError:
+            # 리스너 스레드에서 돌므로 예외를 올리면 스레드가 죽음. 정리는 다음 실행 때 다시
+            pass
+        return True
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    레코드마다 flush하지 않는 파일 핸들러
+
+    파일 하나를 열어 둔 채 쓰기만 하고, flush는 _BatchMemoryHandler가
+    묶음을 다 넘긴 뒤 한 번만 부른다 (레코드마다 write 시스템콜 방지).
+
+    delay=True라 파일은 첫 기록 때 열린다. 이때 열지 못하면(권한 문제, 다른
+    프로세스가 잠금, 디스크 full 등) 콘솔(sys.stderr)로 폴백한다.
+    emit은 QueueListener 스레드에서 돌므로 예외를 밖으로 올리지 않는다
+    (올리면 리스너가 죽고 이후 기록이 큐에 조용히 쌓이기만 함).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 파일 대신 sys.stderr에 쓰는 중인지 (close에서 stderr를 닫지 않기 위함)
+        self._console_fallback = False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                # delay=True: 첫 기록 때 파일을 엶
+                self.stream = self._open_or_console()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+    def _open_or_console(self):
+        """로그 파일을 열고, 실패하면 sys.stderr를 반환 (stderr도 없으면 예외 그대로)"""
+        try:
+            return self._open()
+        except OSError:
+            if sys.stderr is None:
+                raise
+            self._console_fallback = True
+            sys.stderr.write(f"로그 파일을 열 수 없어 콘솔로 기록: {self.baseFilename}\n")
+            return sys.stderr
+
+    def close(self) -> None:
+        if self._console_fallback:
+            # FileHandler.close는 stream을 닫으므로 stderr는 떼어 낸 뒤 닫기
+            self.acquire()
+            try:
+                self.flush()
+                self.stream = None
+            finally:
+                self.release()
+        super().close()
+
+
+class _BatchMemoryHandler(logging.handlers.MemoryHandler):
+    """버퍼를 넘긴 뒤 대상 핸들러를 한 번만 flush하는 MemoryHandler"""
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            super().flush()
+            if self.target:
+                self.target.flush()
+        finally:
+            self.release()
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    포맷팅을 리스너 스레드로 미루는 QueueHandler
+
+    기본 QueueHandler.prepare는 호출 스레드에서 메시지를 %-포맷하고
+    (예외가 있으면 트레이스백 문자열까지 만듦) args를 비운다.
+    같은 프로세스 안의 큐라 레코드를 직렬화할 필요가 없으므로 그대로 넘기고,
+    포맷은 파일 핸들러의 Formatter가 백그라운드에서 한다.
+
+    주의: args는 기록 시점에 포맷되므로 로그 호출 뒤에 바뀌는 객체를 넘기지 말 것
+    (현재 호출부는 문자열/숫자만 넘김)
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _flush_periodically(handler: logging.Handler, stop_event: threading.Event) -> None:
+    """
+    버퍼에 쌓인 로그를 LOG_FLUSH_INTERVAL_SECONDS마다 기록 (INFO가 오래 머물지 않도록)
+
+    Args:
+        handler: 주기적으로 flush할 핸들러 (MemoryHandler)
+        stop_event: 종료 신호
+    """
+    while not stop_event.wait(LOG_FLUSH_INTERVAL_SECONDS):
+        handler.flush()
 
 
 def _create_log_file_path() -> Path:
@@ -73,14 +224,30 @@ def _create_log_file_path() -> Path:
     return LOGS_DIR / f"app_{timestamp}.log"
 
 
+def is_verbose_logging() -> bool:
+    """
+    상세 진단 로그를 남길지 여부 (환경변수 RHELPER_VERBOSE_LOG, 기본 False)
+
+    필드마다 현재 URL/제목 조회, 옵션/행/건물/항목별 로그처럼
+    드라이버 왕복이나 항목 수만큼 기록이 생기는 로그를 감쌀 때 사용.
+    """
+    return _VERBOSE_LOGGING
+
+
 def get_logger() -> logging.Logger:
     """
     애플리케이션 전역에서 사용할 로거를 반환 (싱글톤 패턴)
 
     동작:
-    - 처음 호출 시: logs 폴더 생성, 오래된 로그 정리, 새 로그 파일 생성
+    - 처음 호출 시: logs 폴더 생성, 핸들러 준비
+      (오래된 로그 정리와 새 로그 파일 생성은 첫 기록 때)
     - 이후 호출 시: 기존 로거 재사용 (핸들러 중복 방지)
-    - 파일 생성 실패 시 콘솔(StreamHandler)로 폴백
+    - 파일 생성 실패 시 콘솔로 폴백 (logs 폴더를 못 만들면 StreamHandler,
+      파일을 못 열면 첫 기록 때 sys.stderr)
+    - 로거에는 QueueHandler만 붙이고, 실제 쓰기는 QueueListener 스레드가 담당
+    - 파일 쓰기는 MemoryHandler로 묶어서 처리
+      (LOG_BUFFER_CAPACITY개가 차거나, ERROR 이상이거나, LOG_FLUSH_INTERVAL_SECONDS마다)
+    - 종료 시 atexit에서 큐를 비운 뒤 버퍼까지 모두 씀
 
     로그 설정:
     - 레벨: DEBUG (모든 레벨 기록)
@@ -96,11 +263,18 @@ def get_logger() -> logging.Logger:
         >>> logger.info("애플리케이션 시작")
         # 출력: 2025-11-27 14:30:25 INFO [d:\...\main.py:10 main] 애플리케이션 시작
     """
+    global _configured_logger
+
+    # 빠른 경로: 설정까지 끝난 로거가 있으면 그대로 반환
+    if _configured_logger is not None:
+        return _configured_logger
+
     # 싱글톤 패턴: 이미 초기화된 로거가 있으면 재사용
     logger = logging.getLogger("app")
 
     # 핸들러가 이미 있으면 재사용 (중복 초기화 방지)
     if logger.handlers:
+        _configured_logger = logger
         return logger
 
     # 로그 레벨 설정 (DEBUG 이상 모두 기록)
@@ -113,25 +287,60 @@ def get_logger() -> logging.Logger:
         # logs 폴더 자동 생성
         LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
-        # 오래된 로그 파일 정리 (5개 초과 시 삭제)
-        _cleanup_old_logs()
-
         # 새 로그 파일 경로 생성
         log_file_path = _create_log_file_path()
 
-        # 파일 핸들러 생성
-        handler = logging.FileHandler(log_file_path, mode="w", encoding="utf-8")
+        # 파일 핸들러 생성 (delay=True: 첫 기록 때 파일을 염, flush는 묶음 단위)
+        handler = _BufferedFileHandler(
+            log_file_path, mode="w", encoding="utf-8", delay=True
+        )
+
+        # 오래된 로그 파일 정리 (5개 초과 시 삭제)도 첫 기록 때 한 번만
+        handler.addFilter(_CleanupOnFirstRecord(handler))
     except OSError:
-        # 파일 생성 실패 시 콘솔로 폴백 (권한 문제, 디스크 full 등)
+        # logs 폴더 생성 실패 시 콘솔로 폴백 (권한 문제 등)
+        # 파일 자체를 열지 못하는 경우는 첫 기록 때 _BufferedFileHandler가 처리
         handler = logging.StreamHandler()
 
     # 핸들러에 포맷터 적용
     handler.setFormatter(formatter)
 
-    # 로거에 핸들러 추가
-    logger.addHandler(handler)
+    # 레코드마다 쓰고 flush하지 않도록 메모리에 모았다가 한 번에 기록
+    buffered_handler = _BatchMemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=handler,
+        flushOnClose=True,
+    )
+
+    # 호출 스레드에서 디스크 I/O를 하지 않도록 큐로 넘기고 백그라운드에서 기록
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, buffered_handler, respect_handler_level=True
+    )
+    listener.start()
+
+    flush_stop = threading.Event()
+    threading.Thread(
+        target=_flush_periodically,
+        args=(buffered_handler, flush_stop),
+        name="log-flush",
+        daemon=True,
+    ).start()
+
+    def _shutdown() -> None:
+        # 순서 중요: 큐를 먼저 비워야 마지막 기록까지 버퍼에 들어간 뒤 flush됨
+        flush_stop.set()
+        listener.stop()
+        buffered_handler.close()
+
+    atexit.register(_shutdown)
+
+    _configured_logger = logger
+
+    # 로거에는 큐 핸들러만 추가 (포맷은 리스너 스레드에서)
+    logger.addHandler(_DeferredQueueHandler(log_queue))
 
-    # 로거 초기화 완료 로그 기록
-    logger.info("로거 초기화 완료")
+    # 초기화 로그는 남기지 않음 (남기면 import만으로 파일이 생김)
 
     return logger